@@ -0,0 +1,17 @@
+from enum import Enum
+from typing import Any, NamedTuple
+
+
+class EventKind(Enum):
+    IN_VIEW_CHANGED = "in_view_changed"
+    TRACKED_CHANGED = "tracked_changed"
+    FIX_ACQUIRED = "fix_acquired"
+    FIX_LOST = "fix_lost"
+    MODE_CHANGED = "mode_changed"
+
+
+class ChangeEvent(NamedTuple):
+    timestamp: float
+    kind: EventKind
+    old: Any  # None for the first observation
+    new: Any
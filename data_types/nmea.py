@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class NMEASentence(Enum):
@@ -15,3 +15,56 @@ class NMEAField(Enum):
     LONGITUDE = 3
     SATELLITES_TRACKED = 7
     FIX_STATUS = 6
+
+
+class SatelliteStatus(Enum):
+    TRACKED = "tracked"
+    IN_VIEW = "in_view"
+
+
+class FixQuality(IntEnum):
+    """GGA fix quality indicator (field 6)."""
+
+    UNKNOWN = -1
+    NO_FIX = 0
+    GPS_FIX = 1
+    DGPS_FIX = 2
+    PPS_FIX = 3
+    RTK = 4
+    FLOAT_RTK = 5
+    ESTIMATED = 6  # Dead reckoning
+    MANUAL_INPUT = 7
+    SIMULATION = 8
+
+
+class FixMode(IntEnum):
+    """GSA fix mode (1 = no fix, 2 = 2D, 3 = 3D). NO_MODE marks an empty field."""
+
+    NO_MODE = 0
+    NO_FIX = 1
+    FIX_2D = 2
+    FIX_3D = 3
+
+
+class DataStatus(IntEnum):
+    """RMC data status ('A' = data valid, 'V' = data not valid)."""
+
+    INVALID = 0
+    VALID = 1
+
+
+# Raw field value -> enum member lookups shared by the sentence parsers
+FIX_QUALITY_BY_CODE = {
+    str(quality.value): quality for quality in FixQuality if quality >= 0
+}
+FIX_MODE_BY_CODE = {
+    "": FixMode.NO_MODE,
+    "1": FixMode.NO_FIX,
+    "2": FixMode.FIX_2D,
+    "3": FixMode.FIX_3D,
+}
+DATA_STATUS_BY_CODE = {"A": DataStatus.VALID, "V": DataStatus.INVALID}
+
+# Fix modes and qualities that count as a position fix
+FIX_MODES_WITH_FIX = frozenset((FixMode.FIX_2D, FixMode.FIX_3D))
+FIX_QUALITIES_WITH_FIX = frozenset(quality for quality in FixQuality if quality > 0)
@@ -0,0 +1,50 @@
+from typing import NamedTuple, Optional
+
+from data_types.nmea import DataStatus, FixMode, FixQuality
+
+
+class GGARecord(NamedTuple):
+    timestamp: float
+    fix_quality: Optional[FixQuality]
+    satellites_tracked: Optional[int]
+
+
+class GSARecord(NamedTuple):
+    timestamp: float
+    fix_mode: Optional[FixMode]
+    num_satellites_tracked: Optional[int]
+
+
+class RMCRecord(NamedTuple):
+    timestamp: float
+    status: Optional[DataStatus]
+
+
+class GSVRecord(NamedTuple):
+    timestamp: float
+    total_messages: int
+    message_number: int
+    satellites_in_view: int
+    satellite_ids: list[str]
+
+
+class SatelliteStats(NamedTuple):
+    in_view_mean: Optional[float]
+    in_view_max: Optional[int]
+    tracked_mean: Optional[float]
+    tracked_max: Optional[int]
+    samples: int  # GGA and GPGSA sentences with a satellite count
+
+
+class WindowSummary(NamedTuple):
+    start: float
+    end: float
+    in_view_mean: Optional[float]
+    in_view_min: Optional[int]
+    in_view_max: Optional[int]
+    tracked_mean: Optional[float]
+    tracked_min: Optional[int]
+    tracked_max: Optional[int]
+    fix_availability: Optional[float]  # % of GGA sentences with a fix
+    fix_2d_share: Optional[float]  # % of the time with a known fix mode spent in 2D
+    fix_3d_share: Optional[float]  # % of the time with a known fix mode spent in 3D
@@ -1,7 +1,10 @@
 import click
 
 from handlers.uart import UART
+from services.aggregation import WindowedAggregator
 from utils.offline_parser import OfflineNMEAProcessor
+from utils.campaign_processor import CampaignProcessor, format_summary_table
+from utils.range_query import RangeQueryProcessor
 from utils.live_parser import LiveNMEAParser
 
 from serial import PARITY_NONE
@@ -16,18 +19,122 @@ def main():
 @click.option(
     "--input",
     "-i",
-    type=click.Path(exists=True),
+    type=click.Path(exists=True, dir_okay=False),
     required=True,
-    help="Path to the NMEA log file.",
+    help="Path to the NMEA log file (plain text or gzip/bz2/xz/zstd compressed).",
 )
-def offline_parser(input: str):
+@click.option(
+    "--window",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Plot mean/min/max per window of this many seconds instead of every sample.",
+)
+@click.option(
+    "--step",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Distance between window starts in seconds for sliding windows - Default: --window.",
+)
+@click.option(
+    "--index",
+    "build_index",
+    is_flag=True,
+    default=False,
+    help="Save a sparse time index (<input>.idx) while parsing, used by the query command.",
+)
+@click.option(
+    "--events",
+    "events_file",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Record state changes only and export them with the run-length encoded data as JSON to this path.",
+)
+def offline_parser(
+    input: str, window: float, step: float, build_index: bool, events_file: str
+):
     """
     Parses the offline NMEA log file and plots the number of satellites tracked as a function of time and outputs time to first fix (TTFF)
     """
-    parser = OfflineNMEAProcessor(input)
+    if step and not window:
+        raise click.UsageError("--step requires --window")
+    if step:
+        try:
+            WindowedAggregator(window, step)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--step")
+
+    parser = OfflineNMEAProcessor(input, window, step, build_index, events_file)
     parser.process()
 
 
+@main.command(name="query")
+@click.option(
+    "--input",
+    "-i",
+    type=click.Path(exists=True, dir_okay=False),
+    required=True,
+    help="Path to the NMEA log file (plain text or gzip/bz2/xz/zstd compressed).",
+)
+@click.option("--start", type=float, required=True, help="First timestamp (seconds).")
+@click.option("--end", type=float, required=True, help="Last timestamp (seconds).")
+@click.option(
+    "--every-lines",
+    type=click.IntRange(min=1),
+    default=10000,
+    show_default=True,
+    help="Lines between index checkpoints when the index has to be built.",
+)
+@click.option(
+    "--every-seconds",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Log seconds between index checkpoints when the index has to be built.",
+)
+def range_query(
+    input: str, start: float, end: float, every_lines: int, every_seconds: float
+):
+    """
+    Prints the satellite data rows between two timestamps of a log, using a sparse time index (<input>.idx) built on first use
+    """
+    if end < start:
+        raise click.BadParameter("must not be before --start", param_hint="--end")
+
+    processor = RangeQueryProcessor(input, every_lines, every_seconds)
+    for timestamp, sat_type, count in processor.query(start, end):
+        click.echo(f"{timestamp},{sat_type},{count}")
+
+
+@main.command(name="process-campaign")
+@click.option(
+    "--input",
+    "-i",
+    required=True,
+    help='Directory of NMEA log files or a glob pattern (e.g. "captures/**/*.txt.gz").',
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False),
+    default="campaign_summary.csv",
+    show_default=True,
+    help="CSV summary file. Files already listed in it are skipped.",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes - Default: number of CPUs.",
+)
+def campaign_parser(input: str, output: str, workers: int):
+    """
+    Parses a campaign of NMEA log files in parallel and prints a merged summary (TTFF, fix availability, satellite counts) per file
+    """
+    processor = CampaignProcessor(input, output, workers)
+    rows = processor.process()
+    click.echo(format_summary_table(rows))
+
+
 # Note: This was not tested and is a conceptual approach to using serial to parse data
 @main.command(name="process-live-data")
 @click.option(
@@ -55,7 +162,15 @@ def offline_parser(input: str):
     default=None,
     help="Stop bit setting for serial communication.",
 )
-def live_parser(serial_port: str, baudrate: int, parity: int, stopbit: int):
+@click.option(
+    "--window",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Plot mean/min/max per window of this many seconds instead of every sample.",
+)
+def live_parser(
+    serial_port: str, baudrate: int, parity: int, stopbit: int, window: float
+):
     """
     Parses live NMEA data via the serial port.
     """
@@ -69,7 +184,7 @@ def live_parser(serial_port: str, baudrate: int, parity: int, stopbit: int):
     parity = parity or config_values.get("parity")
     stopbit = stopbit or config_values.get("stopbit")
 
-    live_parser = LiveNMEAParser(serial_port, baudrate, parity, stopbit)
+    live_parser = LiveNMEAParser(serial_port, baudrate, parity, stopbit, window)
     live_parser.parse_and_plot()
 
 
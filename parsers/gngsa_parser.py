@@ -1,14 +1,18 @@
 from typing import Optional
+from data_types.nmea import FIX_MODE_BY_CODE, FixMode, NMEASentence
+from data_types.records import GSARecord
 from parsers.base_parser import BaseNMEAParser
+from parsers.registry import register_parser
 from utils.logger import Logger
 
 
+@register_parser(NMEASentence.GNGSA.value, fields=(2,))
 class GNGSAParser(BaseNMEAParser):
     def __init__(self) -> None:
         super().__init__()
         self.logger = Logger(__name__)
 
-    def parse(self, timestamp: float, fields: list[str]) -> dict[str, Optional[str]]:
+    def parse(self, timestamp: float, fields: list[str]) -> GSARecord:
         """
         Parse a GNGSA NMEA sentence and extract relevant information.
 
@@ -17,28 +21,20 @@ class GNGSAParser(BaseNMEAParser):
             fields (list[str]): List of fields extracted from the NMEA sentence.
 
         Returns:
-            Dict[str, Optional[str]]: A dictionary containing the parsed data, including:
+            GSARecord: A record containing the parsed data, including:
                 - 'timestamp': The timestamp as a float.
-                - 'fix_status': Fix status ('No Fix', '2D Fix', '3D Fix') as a string.
-                  Defaults to None in case of parsing errors.
+                - 'fix_mode': Fix mode as a `FixMode` member (`FixMode.NO_MODE` for an empty field).
+                  None, and logged, for unrecognized codes.
+                - 'num_satellites_tracked': Always None, GNGSA satellites are not counted.
 
-            Returns a dictionary with 'fix_status' set to None if parsing fails.
+            Returns a record with 'fix_mode' set to None if parsing fails.
         """
-        data = {
-            "timestamp": timestamp,
-            "fix_status": None,  # Default fix status in case of parsing errors
-        }
+        fix_mode: Optional[FixMode] = None
 
         try:
-            mode = int(fields[2])
-            if mode == 1:
-                data["fix_status"] = "No Fix"
-            elif mode == 2:
-                data["fix_status"] = "2D Fix"
-            elif mode == 3:
-                data["fix_status"] = "3D Fix"
-        except (ValueError, IndexError) as e:
+            fix_mode = FIX_MODE_BY_CODE[fields[2]]
+        except (KeyError, IndexError) as e:
             self.logger.error(f"Error parsing GNGSA sentence: {','.join(fields)}")
             self.logger.error(f"{str(e)}")
 
-        return data
+        return GSARecord(timestamp, fix_mode, None)
@@ -1,14 +1,18 @@
 from typing import Optional
+from data_types.nmea import FIX_QUALITY_BY_CODE, FixQuality, NMEASentence
+from data_types.records import GGARecord
 from parsers.base_parser import BaseNMEAParser
+from parsers.registry import register_parser
 from utils.logger import Logger
 
 
+@register_parser(NMEASentence.GPGGA.value, fields=(6, 7))
 class GPGGAParser(BaseNMEAParser):
     def __init__(self) -> None:
         super().__init__()
         self.logger = Logger(__name__)
 
-    def parse(self, timestamp: float, fields: list[str]) -> dict[str, Optional[str]]:
+    def parse(self, timestamp: float, fields: list[str]) -> GGARecord:
         """
         Parse a GPGGA NMEA sentence and extract relevant information.
 
@@ -17,45 +21,27 @@ class GPGGAParser(BaseNMEAParser):
             fields (list[str]): List of fields extracted from the NMEA sentence.
 
         Returns:
-            Dict[str, Optional[str]]: A dictionary containing the parsed data, including:
+            GGARecord: A record containing the parsed data, including:
                 - 'timestamp': The timestamp as a float.
-                - 'fix_status': Fix status ('No Fix', '2D Fix', '3D Fix') as a string.
+                - 'fix_quality': Fix quality as a `FixQuality` member
+                  (`FixQuality.UNKNOWN` for unrecognized codes).
                   Defaults to None in case of parsing errors.
                 - 'satellites_tracked': Number of satellites tracked as an integer.
                   Defaults to None in case of parsing errors.
 
-            Returns a dictionary with None values for fix_status and satellites_tracked if parsing fails.
+            Returns a record with None values for fix_quality and satellites_tracked if parsing fails.
         """
-        data = {
-            "timestamp": timestamp,
-            "fix_status": None,  # Default fix status in case of parsing errors
-            "satellites_tracked": None,  # Default value in case of parsing errors
-        }
+        fix_quality: Optional[FixQuality] = None
+        satellites_tracked: Optional[int] = None
 
         try:
             if len(fields) >= 8:
-                # Convert the fix status from a number to a descriptive string
-                fix_status_map = {
-                    "0": "No Fix",
-                    "1": "GPS Fix",
-                    "2": "DGPS Fix",
-                    "3": "PPS Fix",
-                    "4": "Real Time Kinematic",
-                    "5": "Float RTK",
-                    "6": "Estimated (dead reckoning)",
-                    "7": "Manual input mode",
-                    "8": "Simulation mode",
-                }
-                fix_status = fields[6]
-                data["fix_status"] = fix_status_map.get(fix_status, "Unknown")
+                fix_quality = FIX_QUALITY_BY_CODE.get(fields[6], FixQuality.UNKNOWN)
 
                 # Parse the number of satellites tracked
-                satellites_tracked = fields[7]
-                data["satellites_tracked"] = (
-                    int(satellites_tracked) if satellites_tracked else 0
-                )
+                satellites_tracked = int(fields[7]) if fields[7] else 0
         except (ValueError, IndexError) as e:
             self.logger.error(f"Error parsing GPGGA sentence: {','.join(fields)}")
             self.logger.error(str(e))
 
-        return data
+        return GGARecord(timestamp, fix_quality, satellites_tracked)
@@ -1,16 +1,18 @@
-from typing import Union
+from typing import Optional
+from data_types.nmea import FIX_MODE_BY_CODE, FixMode, NMEASentence
+from data_types.records import GSARecord
 from parsers.base_parser import BaseNMEAParser
+from parsers.registry import register_parser
 from utils.logger import Logger
 
 
+@register_parser(NMEASentence.GPGSA.value, fields=range(2, 15))
 class GPGSAParser(BaseNMEAParser):
     def __init__(self) -> None:
         super().__init__()
         self.logger = Logger(__name__)
 
-    def parse(
-        self, timestamp: float, fields: list[str]
-    ) -> dict[str, Union[float, str, int]]:
+    def parse(self, timestamp: float, fields: list[str]) -> GSARecord:
         """
         Parse a GPGSA NMEA sentence and extract relevant information.
 
@@ -19,39 +21,25 @@ class GPGSAParser(BaseNMEAParser):
             fields (list[str]): List of fields extracted from the NMEA sentence.
 
         Returns:
-            Dict[str, Union[float, str, int]]: A dictionary containing the parsed data, including:
+            GSARecord: A record containing the parsed data, including:
                 - 'timestamp': The timestamp as a float.
-                - 'fix_status': Fix status ('No Fix', '2D Fix', '3D Fix') as a string.
+                - 'fix_mode': Fix mode as a `FixMode` member (`FixMode.NO_MODE` for an empty field).
+                  None, and logged, for unrecognized codes.
                 - 'num_satellites_tracked': Number of satellites being tracked.
 
-            Returns a dictionary with 'fix_status' and 'num_satellites_tracked' set to None if parsing fails.
+            Returns a record with None values for the fields that could not be parsed.
         """
-        data = {
-            "timestamp": timestamp,
-            "fix_status": None,  # Default fix status in case of parsing errors
-            "num_satellites_tracked": None,  # Default number of satellites in case of parsing errors
-        }
+        fix_mode: Optional[FixMode] = None
+        num_satellites_tracked: Optional[int] = None
 
         try:
-            mode = fields[1]
-            if mode == "":
-                data["fix_status"] = "No Mode"  # Handle empty string
-            elif mode == "1":
-                data["fix_status"] = "No Fix"
-            elif mode == "2":
-                data["fix_status"] = "2D Fix"
-            elif mode == "3":
-                data["fix_status"] = "3D Fix"
-
-            # Extract satellite IDs
-            satellite_ids = fields[2:14]
-
             # Count non-empty satellite IDs
-            num_satellites_tracked = sum(1 for sat_id in satellite_ids if sat_id)
-            data["num_satellites_tracked"] = num_satellites_tracked
+            num_satellites_tracked = sum(1 for sat_id in fields[3:15] if sat_id)
+
+            fix_mode = FIX_MODE_BY_CODE[fields[2]]
 
-        except (ValueError, IndexError) as e:
+        except (KeyError, ValueError, IndexError) as e:
             self.logger.error(f"Error parsing GPGSA sentence: {','.join(fields)}")
             self.logger.error(f"{e}")
 
-        return data
+        return GSARecord(timestamp, fix_mode, num_satellites_tracked)
@@ -1,34 +1,53 @@
+from typing import Optional
+from data_types.nmea import NMEASentence
+from data_types.records import GSVRecord
 from parsers.base_parser import BaseNMEAParser
+from parsers.registry import register_parser
 from utils.logger import Logger
 
 
+@register_parser(NMEASentence.GPGSV.value)
 class GPGSVParser(BaseNMEAParser):
     def __init__(self) -> None:
         super().__init__()
         self.logger = Logger(__name__)
 
-    def parse(self, timestamp: float, fields: list) -> dict:
+    def parse(self, timestamp: float, fields: list[str]) -> Optional[GSVRecord]:
         """
-        Parse the GPGSV sentence fields.
+        Parse a GPGSV NMEA sentence and extract relevant information.
+
+        Args:
+            timestamp (float): The timestamp associated with the sentence.
+            fields (list[str]): List of fields extracted from the NMEA sentence.
+
+        Returns:
+            Optional[GSVRecord]: A record containing the parsed data, including:
+                - 'timestamp': The timestamp as a float.
+                - 'total_messages': Number of GSV messages in this cycle.
+                - 'message_number': Number of this message in the cycle.
+                - 'satellites_in_view': Total number of satellites in view.
+                - 'satellite_ids': PRNs of the (up to four) satellites in this message.
+
+            Returns None if parsing fails.
         """
         try:
-            total_messages = int(fields[0]) if fields[0] else 0
-            message_number = int(fields[1]) if fields[1] else 0
-            satellites_in_view = int(fields[2]) if fields[2] else 0
+            total_messages = int(fields[1]) if fields[1] else 0
+            message_number = int(fields[2]) if fields[2] else 0
+            satellites_in_view = int(fields[3]) if fields[3] else 0
 
-            # Extract satellite IDs
-            satellite_data = fields[3:]
+            # Each satellite is a (PRN, elevation, azimuth, SNR) block
             satellite_ids = [
-                satellite_data[i] for i in range(0, len(satellite_data), 4)
+                sat_id for sat_id in fields[4::4] if sat_id and "*" not in sat_id
             ]
 
-            return {
-                "timestamp": timestamp,
-                "total_messages": total_messages,
-                "message_number": message_number,
-                "satellites_in_view": satellites_in_view,
-                "satellite_ids": satellite_ids,
-            }
-        except ValueError as e:
-            self.logger.error(f"Error parsing GPGSV sentence: {e}")
+            return GSVRecord(
+                timestamp,
+                total_messages,
+                message_number,
+                satellites_in_view,
+                satellite_ids,
+            )
+        except (ValueError, IndexError) as e:
+            self.logger.error(f"Error parsing GPGSV sentence: {','.join(fields)}")
+            self.logger.error(str(e))
             return None
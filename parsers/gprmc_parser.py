@@ -1,14 +1,18 @@
 from typing import Optional
+from data_types.nmea import DATA_STATUS_BY_CODE, NMEASentence
+from data_types.records import RMCRecord
 from parsers.base_parser import BaseNMEAParser
+from parsers.registry import register_parser
 from utils.logger import Logger
 
 
+@register_parser(NMEASentence.GPRMC.value, fields=(2,))
 class GPRMCParser(BaseNMEAParser):
     def __init__(self) -> None:
         super().__init__()
         self.logger = Logger(__name__)
 
-    def parse(self, timestamp: float, fields: list[str]) -> Optional[dict[str, str]]:
+    def parse(self, timestamp: float, fields: list[str]) -> Optional[RMCRecord]:
         """
         Parse a GPRMC NMEA sentence and extract relevant information.
 
@@ -17,18 +21,16 @@ class GPRMCParser(BaseNMEAParser):
             fields (list[str]): List of fields extracted from the NMEA sentence.
 
         Returns:
-            Optional[Dict[str, str]]: A dictionary containing the parsed data, including:
+            Optional[RMCRecord]: A record containing the parsed data, including:
                 - 'timestamp': The timestamp as a float.
-                - 'fix_status': GPS data status ('A' = data valid, 'V' = data not valid).
+                - 'status': GPS data status (`DataStatus.VALID` for 'A', `DataStatus.INVALID`
+                  for 'V', None for anything else).
 
             Returns None if parsing fails.
         """
-        data = {}
         try:
-            data["timestamp"] = timestamp
-            data["fix_status"] = fields[2]  # 'A' = data valid, 'V' = data not valid
-            return data
-        except (ValueError, IndexError) as e:
+            return RMCRecord(timestamp, DATA_STATUS_BY_CODE.get(fields[2]))
+        except IndexError as e:
             self.logger.error(f"Error parsing GPRMC sentence: {','.join(fields)}")
             self.logger.error(f"Error details: {str(e)}")
 
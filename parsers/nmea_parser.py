@@ -1,26 +1,47 @@
 import re
+from typing import Any, Callable, Iterator, Optional
 from utils.logger import Logger
-from data_types.nmea import NMEASentence
+from utils.log_reader import open_log, open_log_at
+from data_types.nmea import (
+    FIX_MODES_WITH_FIX,
+    FIX_QUALITIES_WITH_FIX,
+    NMEASentence,
+    SatelliteStatus,
+)
+from data_types.events import ChangeEvent
+from data_types.records import GSARecord, SatelliteStats
 from handlers.base import BaseIO
-from parsers.gpgga_parser import GPGGAParser
-from parsers.gprmc_parser import GPRMCParser
-from parsers.gpgsa_parser import GPGSAParser
-from parsers.gngsa_parser import GNGSAParser
-from enum import Enum
+from parsers.registry import build_dispatch_table, load_entry_point_parsers
+from services.aggregation import WindowedAggregator
+from services.events import ChangeEventRecorder
+from services.time_index import TimeIndex
 
+# Imported for their side effect of registering the built-in sentence parsers
+import parsers.gpgga_parser  # noqa: F401
+import parsers.gprmc_parser  # noqa: F401
+import parsers.gpgsa_parser  # noqa: F401
+import parsers.gngsa_parser  # noqa: F401
+import parsers.gpgsv_parser  # noqa: F401
 
-class SatelliteStatus(Enum):
-    TRACKED = "tracked"
-    IN_VIEW = "in_view"
+# Sentence ids and row labels resolved once instead of on every sentence
+GPGGA = NMEASentence.GPGGA.value
+GPGSA = NMEASentence.GPGSA.value
+IN_VIEW = SatelliteStatus.IN_VIEW.value
+TRACKED = SatelliteStatus.TRACKED.value
 
-
-class FixStatus(Enum):
-    FIX_2D = "2D Fix"
-    FIX_3D = "3D Fix"
+# Sentences whose records feed the satellite rows, fix metrics and events. Other
+# registered sentences are only parsed when a record sink is attached for them
+BUILT_IN_SENTENCES = (GPGGA, GPGSA, NMEASentence.GNGSA.value)
 
 
 class NMEAParser(BaseIO):
-    def __init__(self, config_path: str = None, input_file: str = None):
+    def __init__(
+        self,
+        config_path: str = None,
+        input_file: str = None,
+        aggregator: WindowedAggregator = None,
+        record_events: bool = False,
+    ):
         super().__init__(config_path)
         self.logger = Logger(__name__)
 
@@ -30,32 +51,202 @@ class NMEAParser(BaseIO):
         self.field_separator = nmea_log_config.get("field_separator", ",")
         self.nmea_type_prefix = nmea_log_config.get("nmea_type_prefix", "$")
 
-        self.parsers = {
-            NMEASentence.GPGGA: GPGGAParser(),
-            NMEASentence.GPRMC: GPRMCParser(),
-            NMEASentence.GPGSA: GPGSAParser(),
-            NMEASentence.GNGSA: GNGSAParser(),
+        self.timestamp_pattern = re.compile(
+            re.escape(self.timestamp_prefix) + r"(\d+\.\d+|\d+)"
+        )
+        self.sentence_type_pattern = re.compile(
+            re.escape(self.nmea_type_prefix) + r"([A-Za-z][A-Za-z0-9]+)"
+        )
+
+        # Flat sentence id -> (parse method, maxsplit) table compiled once from the registry
+        load_entry_point_parsers()
+        self.parsers = build_dispatch_table()
+        # sentence id -> callables receiving every record parsed for that sentence
+        self.record_sinks: dict[str, list[Callable[[Any], None]]] = {}
+        self.active_parsers = {
+            sentence_id: entry
+            for sentence_id, entry in self.parsers.items()
+            if sentence_id in BUILT_IN_SENTENCES
         }
 
+        self.input_file = input_file
+        # Optional streaming window aggregation, replaces `self.data` when set
+        self.aggregator = aggregator
+        # In event mode rows go to a ChangeEventRecorder instead of `self.data`
+        self.record_events = record_events
+        self.reset()
+
+    def add_record_sink(self, sentence_id: str, sink: Callable[[Any], None]):
+        """
+        Passes every record parsed for `sentence_id` to `sink`, e.g. to consume the
+        output of a custom registered parser without changing this class. Sinks are
+        kept across `reset`.
+
+        Args:
+            sentence_id (str): Sentence identifier, e.g. "GPGSV" or "PUBX".
+            sink (Callable[[Any], None]): Called with each non-empty record, in log order.
+
+        Raises:
+            KeyError: If no parser is registered for `sentence_id`.
+        """
+        if sentence_id not in self.parsers:
+            raise KeyError(f"No parser registered for sentence {sentence_id}")
+        self.record_sinks.setdefault(sentence_id, []).append(sink)
+        self.active_parsers[sentence_id] = self.parsers[sentence_id]
+
+    def reset(self):
+        """
+        Clears all parsing state so the same instance can be reused for another log.
+        """
         self.data = []
+        self.event_recorder = ChangeEventRecorder() if self.record_events else None
+        self.last_row = None  # Drives which GSA rows are recorded
         self.log_capture_start_time = None
         self.has_fix = False
-        self.input_file = input_file
         self.ttff = None
         self.num_satellites_in_view = 0  # Initialize the count of satellites in view
+        self.num_gga_sentences = 0
+        self.num_gga_fixes = 0  # GGA sentences reporting a fix quality above "No Fix"
+        # Running satellite count totals over every GGA/GPGSA sentence, unlike the
+        # data rows which skip GSA samples that do not change the plot
+        self.in_view_total = 0
+        self.in_view_max = None
+        self.num_gsa_sentences = 0
+        self.tracked_total = 0
+        self.tracked_max = None
+
+    def get_state(self) -> dict:
+        """
+        Snapshots the parsing state that later sentences depend on, for `restore_state`.
+        """
+        return {
+            "log_capture_start_time": self.log_capture_start_time,
+            "has_fix": self.has_fix,
+            "ttff": self.ttff,
+            "num_satellites_in_view": self.num_satellites_in_view,
+            "num_gga_sentences": self.num_gga_sentences,
+            "num_gga_fixes": self.num_gga_fixes,
+            "in_view_total": self.in_view_total,
+            "in_view_max": self.in_view_max,
+            "num_gsa_sentences": self.num_gsa_sentences,
+            "tracked_total": self.tracked_total,
+            "tracked_max": self.tracked_max,
+            "last_row": list(self.last_row) if self.last_row else None,
+        }
+
+    def restore_state(self, state: dict):
+        """
+        Resets the parser to a state taken with `get_state`. No data rows are kept.
+        """
+        self.reset()
+        self.log_capture_start_time = state["log_capture_start_time"]
+        self.has_fix = state["has_fix"]
+        self.ttff = state["ttff"]
+        self.num_satellites_in_view = state["num_satellites_in_view"]
+        self.num_gga_sentences = state["num_gga_sentences"]
+        self.num_gga_fixes = state["num_gga_fixes"]
+        self.in_view_total = state["in_view_total"]
+        self.in_view_max = state["in_view_max"]
+        self.num_gsa_sentences = state["num_gsa_sentences"]
+        self.tracked_total = state["tracked_total"]
+        self.tracked_max = state["tracked_max"]
+        if state["last_row"]:
+            self.last_row = tuple(state["last_row"])
 
-    def parse_log_file(self, input_file: str):
-        with open(input_file, "r") as file:
+    def parse_log_file(self, input_file: str, index: TimeIndex = None):
+        """
+        Parses every line of a log file.
+
+        Args:
+            input_file (str): Path to the plain text or compressed NMEA log.
+            index (TimeIndex, optional): Sparse time index filled with checkpoints while
+                parsing, for later `parse_log_range` calls. Defaults to None.
+        """
+        if index is not None:
+            self._parse_and_index(input_file, index)
+            return
+
+        # Plain text and gzip/bz2/xz/zstd compressed logs are streamed transparently
+        with open_log(input_file) as file:
             for line in file:
                 line = line.strip()
                 self.parse_sentence(line)
 
+    def _parse_and_index(self, input_file: str, index: TimeIndex):
+        index.start(input_file)
+        # Read as bytes to know the offset of every line
+        with open_log(input_file, binary=True) as file:
+            offset = 0
+            for line_number, raw_line in enumerate(file):
+                line = raw_line.decode("utf-8", "replace").strip()
+                timestamp = self.extract_timestamp(line)
+                if timestamp is not None:
+                    index.checkpoint(timestamp, offset, line_number, self.get_state)
+                    self.parse_nmea(timestamp, line)
+                offset += len(raw_line)
+
+    def parse_log_range(
+        self, input_file: str, start: float, end: float, index: TimeIndex
+    ) -> list[tuple[float, str, int]]:
+        """
+        Parses only the part of a log between two timestamps, resuming from the closest
+        index checkpoint instead of the start of the file. Timestamps are assumed to
+        increase through the log.
+
+        Args:
+            input_file (str): Path to the log the index was built from.
+            start (float): First timestamp to return.
+            end (float): Last timestamp to return.
+            index (TimeIndex): Index built by `parse_log_file` for this log.
+
+        Returns:
+            list[tuple[float, str, int]]: The data rows with timestamps in [start, end],
+                identical to the matching rows of a full parse.
+        """
+        checkpoint = index.lookup(start)
+        offset = 0
+        if checkpoint is None:
+            self.reset()
+        else:
+            offset, state = checkpoint
+            self.restore_state(state)
+
+        with open_log_at(input_file, offset, index.members) as file:
+            for raw_line in file:
+                line = raw_line.decode("utf-8", "replace").strip()
+                timestamp = self.extract_timestamp(line)
+                if timestamp is None:
+                    continue
+                if timestamp > end:
+                    break
+                self.parse_nmea(timestamp, line)
+
+        return [row for row in self.get_data() if row[0] >= start]
+
+    def extract_timestamp(self, line: str) -> Optional[float]:
+        """
+        Returns the `t=<seconds>` timestamp of a log line, or None if it has none.
+        """
+        timestamp_match = self.timestamp_pattern.search(line)
+        if not timestamp_match:
+            self.logger.error(f"No timestamp found in: {line}")
+            return None
+        return float(timestamp_match.group(1))
+
     def parse_sentence(self, sentence: str):
-        try:
-            timestamp_match = re.search(r"t=(\d+\.\d+|\d+)", sentence)
-            timestamp_str = timestamp_match.group(1)
-            timestamp = float(timestamp_str)
+        """
+        Parses a log line made of a `t=<seconds>` timestamp followed by an NMEA sentence.
+        """
+        timestamp = self.extract_timestamp(sentence)
+        if timestamp is not None:
+            self.parse_nmea(timestamp, sentence)
 
+    def parse_nmea(self, timestamp: float, sentence: str):
+        """
+        Parses an NMEA sentence received at `timestamp`, e.g. a live sentence stamped
+        with its arrival time.
+        """
+        try:
             # Add a variable to track the start time of satellite tracking
             if self.log_capture_start_time is None:
                 self.log_capture_start_time = timestamp
@@ -63,77 +254,169 @@ class NMEAParser(BaseIO):
                     f"Start timestamp for satellite tracking: {self.log_capture_start_time}"
                 )
 
-            sentence_type_match = re.search(r"\$([A-Za-z]{5})", sentence)
+            sentence_type_match = self.sentence_type_pattern.search(sentence)
             if not sentence_type_match:
                 self.logger.error(f"No NMEA sentence type found in: {sentence}")
                 return
             sentence_type = sentence_type_match.group(1)
 
-            if self.field_separator in sentence:
-                sentence_data = sentence.split(self.field_separator, 1)[1]
-            else:
-                sentence_data = sentence
-
-            fields = sentence_data.split(self.field_separator)
-            parser = self.parsers.get(NMEASentence[sentence_type])
-
-            if parser:
-                parsed_data = parser.parse(timestamp, fields)
-                if parsed_data:
-                    if sentence_type == NMEASentence.GPGGA.name:
-                        num_satellites_in_view = int(fields[7]) if fields[7] else 0
-                        self.num_satellites_in_view = (
-                            num_satellites_in_view  # Update the count
+            entry = self.active_parsers.get(sentence_type)
+            if entry is None:
+                return
+            parser, maxsplit = entry
+
+            # Fields are split from the sentence id onwards (fields[0] is "$<id>") and
+            # only as far as the parser needs, leaving the rest of the line unsplit
+            fields = sentence[sentence_type_match.start() :].split(
+                self.field_separator, maxsplit
+            )
+
+            parsed_data = parser(timestamp, fields)
+            if parsed_data:
+                for sink in self.record_sinks.get(sentence_type, ()):
+                    sink(parsed_data)
+
+                if sentence_type == GPGGA:
+                    num_satellites_in_view = parsed_data.satellites_tracked
+                    if num_satellites_in_view is None:
+                        return
+                    self.num_satellites_in_view = num_satellites_in_view
+                    self.num_gga_sentences += 1
+                    if parsed_data.fix_quality in FIX_QUALITIES_WITH_FIX:
+                        self.num_gga_fixes += 1
+                    self.in_view_total += num_satellites_in_view
+                    if (
+                        self.in_view_max is None
+                        or num_satellites_in_view > self.in_view_max
+                    ):
+                        self.in_view_max = num_satellites_in_view
+                    self.add_row((timestamp, IN_VIEW, num_satellites_in_view))
+                    if self.event_recorder is not None:
+                        self.event_recorder.record_in_view(
+                            timestamp, num_satellites_in_view
                         )
-                        self.data.append(
-                            (
-                                timestamp,
-                                SatelliteStatus.IN_VIEW.value,
-                                num_satellites_in_view,
+                        if parsed_data.fix_quality is not None:
+                            self.event_recorder.record_fix_quality(
+                                timestamp, parsed_data.fix_quality
                             )
+                    if self.aggregator:
+                        self.aggregator.add_in_view(
+                            timestamp, num_satellites_in_view, parsed_data.fix_quality
                         )
 
-                        # Calculate TTFF based on the first non-zero value of satellites in view
-                        if num_satellites_in_view > 0 and self.ttff is None:
-                            self.ttff = round(
-                                timestamp - self.log_capture_start_time, 2
-                            )
-                            self.logger.info(f"TTFF time: {self.ttff}")
-                    elif sentence_type == NMEASentence.GPGSA.name:
-                        num_satellites_tracked = parsed_data["num_satellites_tracked"]
-                        if (
-                            not self.data
-                            or (
-                                self.data[-1][1] == SatelliteStatus.IN_VIEW.value
-                                and num_satellites_tracked < self.data[-1][2]
-                            )
-                            or (
-                                self.data[-1][1] == SatelliteStatus.TRACKED.value
-                                and num_satellites_tracked >= self.data[-1][2]
-                            )
-                        ):
-                            self.data.append(
-                                (
-                                    timestamp,
-                                    SatelliteStatus.TRACKED.value,
-                                    num_satellites_tracked,
-                                )
-                            )
-                        if not self.has_fix and parsed_data["fix_status"] in [
-                            FixStatus.FIX_2D.value,
-                            FixStatus.FIX_3D.value,
-                        ]:
-                            self.has_fix = True
-                            self.ttff = round(
-                                timestamp - self.log_capture_start_time, 2
-                            )
-                            self.logger.info(f"TTFF time: {self.ttff}")
+                    # Calculate TTFF based on the first non-zero value of satellites in view
+                    if num_satellites_in_view > 0 and self.ttff is None:
+                        self.ttff = round(timestamp - self.log_capture_start_time, 2)
+                        self.logger.info(f"TTFF time: {self.ttff}")
+                elif sentence_type == GPGSA:
+                    num_satellites_tracked = parsed_data.num_satellites_tracked
+                    if num_satellites_tracked is None:
+                        return
+                    self.num_gsa_sentences += 1
+                    self.tracked_total += num_satellites_tracked
+                    if (
+                        self.tracked_max is None
+                        or num_satellites_tracked > self.tracked_max
+                    ):
+                        self.tracked_max = num_satellites_tracked
+                    if self.aggregator:
+                        self.aggregator.add_tracked(timestamp, num_satellites_tracked)
+                    if self.event_recorder is not None:
+                        self.event_recorder.record_tracked(
+                            timestamp, num_satellites_tracked
+                        )
+                    last_row = self.last_row
+                    if (
+                        last_row is None
+                        or (
+                            last_row[1] == IN_VIEW
+                            and num_satellites_tracked < last_row[2]
+                        )
+                        or (
+                            last_row[1] == TRACKED
+                            and num_satellites_tracked >= last_row[2]
+                        )
+                    ):
+                        self.add_row((timestamp, TRACKED, num_satellites_tracked))
+                    if not self.has_fix and parsed_data.fix_mode in FIX_MODES_WITH_FIX:
+                        self.has_fix = True
+                        self.ttff = round(timestamp - self.log_capture_start_time, 2)
+                        self.logger.info(f"TTFF time: {self.ttff}")
+
+                # Fix mode changes from every GSA talker feed the 2D/3D time shares
+                # and the mode change events
+                if type(parsed_data) is GSARecord and parsed_data.fix_mode is not None:
+                    if self.aggregator:
+                        self.aggregator.add_fix_mode(timestamp, parsed_data.fix_mode)
+                    if self.event_recorder is not None:
+                        self.event_recorder.record_fix_mode(
+                            timestamp, parsed_data.fix_mode
+                        )
 
         except ValueError as e:
             self.logger.error(e)
 
+    def add_row(self, row: tuple[float, str, int]):
+        """
+        Records a data row: in the event recorder in event mode, nowhere when an
+        aggregator is set (it keeps only the window summaries), else in `self.data`.
+        """
+        self.last_row = row
+        if self.event_recorder is not None:
+            self.event_recorder.record_row(row)
+        elif self.aggregator is None:
+            self.data.append(row)
+
     def get_data(self):
+        """
+        Returns the dense data rows, rebuilt from the run-length encoding in event mode.
+        Empty when an aggregator is set outside event mode, the rows are then only
+        summarized per window.
+        """
+        if self.event_recorder is not None:
+            return self.event_recorder.get_data()
         return self.data
 
+    def iter_data(self) -> Iterator[tuple[float, str, int]]:
+        """
+        Iterates over the data rows without building a list of them in event mode.
+        """
+        if self.event_recorder is not None:
+            return self.event_recorder.iter_data()
+        return iter(self.data)
+
+    def get_events(self) -> list[ChangeEvent]:
+        """
+        Returns the state transitions recorded in event mode (empty otherwise).
+        """
+        return (
+            self.event_recorder.get_events() if self.event_recorder is not None else []
+        )
+
     def get_ttff(self):
         return self.ttff if hasattr(self, "ttff") else None
+
+    def get_satellite_stats(self) -> SatelliteStats:
+        """
+        Returns the satellite count statistics over every GGA and GPGSA sentence parsed.
+        """
+        in_view_mean = tracked_mean = None
+        if self.num_gga_sentences:
+            in_view_mean = round(self.in_view_total / self.num_gga_sentences, 2)
+        if self.num_gsa_sentences:
+            tracked_mean = round(self.tracked_total / self.num_gsa_sentences, 2)
+        return SatelliteStats(
+            in_view_mean,
+            self.in_view_max,
+            tracked_mean,
+            self.tracked_max,
+            self.num_gga_sentences + self.num_gsa_sentences,
+        )
+
+    def get_fix_availability(self):
+        """
+        Returns the percentage of GGA sentences reporting a fix, or None if no GGA was parsed.
+        """
+        if not self.num_gga_sentences:
+            return None
+        return round(100 * self.num_gga_fixes / self.num_gga_sentences, 2)
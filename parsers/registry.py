@@ -0,0 +1,103 @@
+from importlib.metadata import entry_points
+from typing import Callable, Iterable, Optional
+
+from parsers.base_parser import BaseNMEAParser
+from utils.logger import Logger
+
+# Entry point group third-party packages use to ship additional sentence parsers
+ENTRY_POINT_GROUP = "nmeanlyzer.parsers"
+
+logger = Logger(__name__)
+
+# sentence id -> (parser class, highest field index the parser reads or None for all)
+_registry: dict[str, tuple[type, Optional[int]]] = {}
+_entry_points_loaded = False
+
+
+def register_parser(
+    *sentence_ids: str, fields: Optional[Iterable[int]] = None
+) -> Callable[[type], type]:
+    """
+    Class decorator that registers a parser for one or more NMEA sentence types.
+
+    Args:
+        *sentence_ids (str): Sentence identifiers handled by the parser (e.g. "GPGGA", "PUBX").
+        fields (Iterable[int], optional): Indices of the fields the parser reads. When
+            provided, the framing layer only splits the sentence up to the highest index
+            and leaves the remainder of the line unsplit. Defaults to None (all fields).
+
+    Returns:
+        Callable[[type], type]: The decorator, which returns the class unchanged.
+
+    Example:
+        @register_parser("GPVTG", fields=(1, 5))
+        class GPVTGParser(BaseNMEAParser):
+            ...
+    """
+    max_field = max(fields) if fields else None
+
+    def decorator(parser_cls: type) -> type:
+        if not issubclass(parser_cls, BaseNMEAParser):
+            raise TypeError(f"{parser_cls.__name__} must inherit from BaseNMEAParser")
+
+        for sentence_id in sentence_ids:
+            if sentence_id in _registry:
+                logger.warning(
+                    f"Parser for {sentence_id} overridden by {parser_cls.__name__}"
+                )
+            _registry[sentence_id] = (parser_cls, max_field)
+        return parser_cls
+
+    return decorator
+
+
+def load_entry_point_parsers() -> None:
+    """
+    Imports parsers advertised under the `nmeanlyzer.parsers` entry point group.
+
+    Importing the module is enough to register the parser, since the classes it
+    exposes are decorated with `register_parser`. Entry points are only scanned once
+    per process.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        group = eps.select(group=ENTRY_POINT_GROUP)
+    else:  # Python 3.9 returns a dict of groups
+        group = eps.get(ENTRY_POINT_GROUP, [])
+
+    for entry_point in group:
+        try:
+            entry_point.load()
+        except Exception as e:
+            logger.error(f"Failed to load parser entry point {entry_point.name}: {e}")
+
+
+def build_dispatch_table() -> dict[str, tuple[Callable, int]]:
+    """
+    Compiles the registered parsers into a flat dispatch table.
+
+    Each registered class is instantiated once, so every sentence lookup at parse time
+    is a single dict access returning the bound `parse` method and the `maxsplit` to
+    use when splitting the sentence into fields (-1 to split the whole sentence).
+
+    Returns:
+        dict[str, tuple[Callable, int]]: Mapping of sentence id to (parse method, maxsplit).
+    """
+    instances = {}
+    dispatch_table = {}
+    for sentence_id, (parser_cls, max_field) in _registry.items():
+        if parser_cls not in instances:
+            instances[parser_cls] = parser_cls()
+        # Splitting one past the highest field keeps that field free of the line tail
+        maxsplit = -1 if max_field is None else max_field + 1
+        dispatch_table[sentence_id] = (instances[parser_cls].parse, maxsplit)
+    return dispatch_table
+
+
+def get_registered_sentences() -> list[str]:
+    return list(_registry)
@@ -1,21 +1,87 @@
 import matplotlib.pyplot as plt
-from typing import Optional
+from typing import Iterable, Optional
+from data_types.records import WindowSummary
 from utils.logger import Logger
 
 
 class DataPlotter:
     def __init__(self):
-        self.timestamps = []
+        # Each series keeps its own timestamps, so its line connects consecutive points
+        # instead of breaking at the other series' samples
+        self.tracked_timestamps = []
         self.satellites_tracked = []
+        self.in_view_timestamps = []
         self.satellites_in_view = []
+        # Window summaries drawn instead of the raw points when aggregating
+        self.window_timestamps = []
+        self.window_in_view_means = []
+        self.window_tracked_means = []
         self.logger = Logger(__name__)
 
     def add_data_point(self, timestamp, tracked, in_view):
-        self.timestamps.append(timestamp)
-        self.satellites_tracked.append(tracked)
-        self.satellites_in_view.append(in_view)
+        if tracked is not None:
+            self.tracked_timestamps.append(timestamp)
+            self.satellites_tracked.append(tracked)
+        if in_view is not None:
+            self.in_view_timestamps.append(timestamp)
+            self.satellites_in_view.append(in_view)
 
-    def plot_data(self, data: list[tuple[float, str, int]], ttff: Optional[float]):
+    def add_window(self, window: WindowSummary):
+        self.window_timestamps.append((window.start + window.end) / 2)
+        self.window_in_view_means.append(window.in_view_mean)
+        self.window_tracked_means.append(window.tracked_mean)
+
+    def start_live_plot(self):
+        """
+        Opens a non-blocking figure drawing the points added with `add_data_point`.
+        """
+        plt.ion()
+        self.live_figure, self.live_axes = plt.subplots()
+        (self.live_in_view_line,) = self.live_axes.plot(
+            [], [], label="Satellites in View", marker="o"
+        )
+        (self.live_tracked_line,) = self.live_axes.plot(
+            [], [], label="Satellites Tracked", marker="x"
+        )
+        self.live_axes.set_xlabel("Timestamp")
+        self.live_axes.set_ylabel("Number of Satellites")
+        self.live_axes.set_title("Satellites in View vs. Satellites Tracked")
+        self.live_axes.legend()
+        self.live_axes.grid(True)
+
+    def refresh_live_plot(self, ttff: Optional[float]):
+        """
+        Redraws the live figure with every point added so far, or with the window means
+        if windows were added.
+        """
+        if self.window_timestamps:
+            self.live_in_view_line.set_data(
+                self.window_timestamps, self.window_in_view_means
+            )
+            self.live_tracked_line.set_data(
+                self.window_timestamps, self.window_tracked_means
+            )
+        else:
+            self.live_in_view_line.set_data(
+                self.in_view_timestamps, self.satellites_in_view
+            )
+            self.live_tracked_line.set_data(
+                self.tracked_timestamps, self.satellites_tracked
+            )
+        if ttff:
+            self.live_axes.set_title(
+                f"Satellites in View vs. Satellites Tracked (TTFF: {ttff} seconds)"
+            )
+        self.live_axes.relim()
+        self.live_axes.autoscale_view()
+        self.live_figure.canvas.draw_idle()
+        plt.pause(0.001)
+
+    def stop_live_plot(self):
+        plt.ioff()
+        plt.close(self.live_figure)
+
+    def plot_data(self, data: Iterable[tuple[float, str, int]], ttff: Optional[float]):
         if not data:
             self.logger.error("No data available to plot.")
             return
@@ -49,3 +115,60 @@ class DataPlotter:
         plt.legend()
         plt.grid(True)
         plt.show()
+
+    def plot_windows(self, windows: list[WindowSummary], ttff: Optional[float]):
+        """
+        Plots windowed aggregates: the mean satellite counts per window with their
+        min/max range shaded, and the fix availability on a secondary axis. Suited to
+        long captures where plotting every sample is unreadable.
+        """
+        if not windows:
+            self.logger.error("No data available to plot.")
+            return
+
+        # Each window is drawn at its midpoint
+        timestamps = [(w.start + w.end) / 2 for w in windows]
+
+        fig, ax = plt.subplots()
+        for label, mean_field, min_field, max_field, marker in (
+            ("Satellites in View", "in_view_mean", "in_view_min", "in_view_max", "o"),
+            ("Satellites Tracked", "tracked_mean", "tracked_min", "tracked_max", "x"),
+        ):
+            means = [getattr(w, mean_field) for w in windows]
+            lows = [getattr(w, min_field) for w in windows]
+            highs = [getattr(w, max_field) for w in windows]
+            (line,) = ax.plot(timestamps, means, label=f"{label} (mean)", marker=marker)
+            ax.fill_between(
+                timestamps,
+                [float("nan") if v is None else v for v in lows],
+                [float("nan") if v is None else v for v in highs],
+                color=line.get_color(),
+                alpha=0.2,
+            )
+
+        if ttff:
+            # Adding a space marker to create a legend entry for TTFF
+            ax.plot(
+                [], [], " ", label=f"TTFF: {ttff} seconds", marker="o", color="white"
+            )  # White marker for legend
+
+        availability_ax = ax.twinx()
+        availability_ax.plot(
+            timestamps,
+            [w.fix_availability for w in windows],
+            label="Fix Availability",
+            linestyle="--",
+            color="gray",
+        )
+        availability_ax.set_ylabel("Fix Availability (%)")
+        availability_ax.set_ylim(0, 105)
+
+        ax.set_xlabel("Timestamp")
+        ax.set_ylabel("Number of Satellites")
+        window_length = windows[0].end - windows[0].start
+        ax.set_title(
+            f"Satellites in View vs. Satellites Tracked ({window_length} s windows)"
+        )
+        ax.legend(loc="upper left")
+        ax.grid(True)
+        plt.show()
@@ -0,0 +1,270 @@
+import math
+from collections import deque
+from typing import Iterable, Optional
+
+from data_types.nmea import FIX_QUALITIES_WITH_FIX, FixMode, FixQuality
+from data_types.records import WindowSummary
+
+
+class _Pane:
+    """Running accumulators of one `step` long slice of time."""
+
+    __slots__ = (
+        "index",
+        "in_view_sum",
+        "in_view_count",
+        "in_view_min",
+        "in_view_max",
+        "tracked_sum",
+        "tracked_count",
+        "tracked_min",
+        "tracked_max",
+        "gga_count",
+        "gga_fix_count",
+        "mode_time",
+        "fix_2d_time",
+        "fix_3d_time",
+    )
+
+    def __init__(self, index: int):
+        self.index = index
+        self.in_view_sum = self.in_view_count = 0
+        self.in_view_min = self.in_view_max = None
+        self.tracked_sum = self.tracked_count = 0
+        self.tracked_min = self.tracked_max = None
+        self.gga_count = self.gga_fix_count = 0
+        self.mode_time = self.fix_2d_time = self.fix_3d_time = 0.0
+
+
+def _min(values: Iterable[Optional[int]]) -> Optional[int]:
+    return min((v for v in values if v is not None), default=None)
+
+
+def _max(values: Iterable[Optional[int]]) -> Optional[int]:
+    return max((v for v in values if v is not None), default=None)
+
+
+def _summarize(start: float, end: float, panes: list[_Pane]) -> WindowSummary:
+    in_view_count = sum(p.in_view_count for p in panes)
+    tracked_count = sum(p.tracked_count for p in panes)
+    gga_count = sum(p.gga_count for p in panes)
+    mode_time = sum(p.mode_time for p in panes)
+
+    in_view_mean = tracked_mean = fix_availability = None
+    fix_2d_share = fix_3d_share = None
+    if in_view_count:
+        in_view_mean = round(sum(p.in_view_sum for p in panes) / in_view_count, 2)
+    if tracked_count:
+        tracked_mean = round(sum(p.tracked_sum for p in panes) / tracked_count, 2)
+    if gga_count:
+        gga_fix_count = sum(p.gga_fix_count for p in panes)
+        fix_availability = round(100 * gga_fix_count / gga_count, 2)
+    if mode_time:
+        fix_2d_share = round(100 * sum(p.fix_2d_time for p in panes) / mode_time, 2)
+        fix_3d_share = round(100 * sum(p.fix_3d_time for p in panes) / mode_time, 2)
+
+    return WindowSummary(
+        start,
+        end,
+        in_view_mean,
+        _min(p.in_view_min for p in panes),
+        _max(p.in_view_max for p in panes),
+        tracked_mean,
+        _min(p.tracked_min for p in panes),
+        _max(p.tracked_max for p in panes),
+        fix_availability,
+        fix_2d_share,
+        fix_3d_share,
+    )
+
+
+class WindowedAggregator:
+    def __init__(self, window: float, step: Optional[float] = None):
+        """
+        Streaming aggregation of satellite counts and fix metrics over fixed time windows.
+
+        Windows are aligned to multiples of `step` and cover [start, start + window).
+        With `step` equal to `window` (the default) they are tumbling, with a smaller
+        `step` they slide. Samples are accumulated into `step` long panes and a window
+        is summarized from its panes once it closes, so a sample costs O(1) however
+        many windows overlap it. Only the panes of the windows still open are kept,
+        every closed window is reduced to one `WindowSummary`. Windows without any
+        sample are not reported.
+
+        Samples are expected in timestamp order, samples older than the oldest open
+        window are dropped.
+
+        Args:
+            window (float): Window length in seconds.
+            step (float, optional): Distance between window starts in seconds, `window`
+                must be a multiple of it. Defaults to `window` (tumbling windows).
+        """
+        if window <= 0:
+            raise ValueError("Window length must be positive")
+        step = step or window
+        if step <= 0 or step > window:
+            raise ValueError(
+                "Window step must be positive and no larger than the window"
+            )
+        panes_per_window = window / step
+        if abs(panes_per_window - round(panes_per_window)) > 1e-9:
+            raise ValueError("Window length must be a multiple of the window step")
+
+        self.window = window
+        self.step = step
+        self.completed: list[WindowSummary] = []
+
+        self._panes_per_window = round(panes_per_window)
+        self._panes: deque[_Pane] = deque()
+        # Index of the first window that has not been summarized yet
+        self._next_window: Optional[int] = None
+        # Fix mode in effect since `_mode_since`, credited to panes as time passes
+        self._mode: Optional[FixMode] = None
+        self._mode_since: Optional[float] = None
+
+    def add_in_view(
+        self, timestamp: float, count: int, fix_quality: Optional[FixQuality] = None
+    ) -> None:
+        """
+        Adds a GGA sample: the satellite count and, optionally, its fix quality.
+        """
+        pane = self._advance(timestamp)
+        if pane is None:
+            return
+        pane.in_view_sum += count
+        pane.in_view_count += 1
+        if pane.in_view_min is None or count < pane.in_view_min:
+            pane.in_view_min = count
+        if pane.in_view_max is None or count > pane.in_view_max:
+            pane.in_view_max = count
+        if fix_quality is not None:
+            pane.gga_count += 1
+            if fix_quality in FIX_QUALITIES_WITH_FIX:
+                pane.gga_fix_count += 1
+
+    def add_tracked(self, timestamp: float, count: int) -> None:
+        """
+        Adds a GSA sample of the number of satellites used in the fix.
+        """
+        pane = self._advance(timestamp)
+        if pane is None:
+            return
+        pane.tracked_sum += count
+        pane.tracked_count += 1
+        if pane.tracked_min is None or count < pane.tracked_min:
+            pane.tracked_min = count
+        if pane.tracked_max is None or count > pane.tracked_max:
+            pane.tracked_max = count
+
+    def add_fix_mode(self, timestamp: float, fix_mode: FixMode) -> None:
+        """
+        Records the fix mode reported at `timestamp`. The mode is held until the next
+        report, and the 2D/3D shares of each window are weighted by that held time.
+        Time falling in panes without any sample is not credited.
+        """
+        self._advance(timestamp)
+        self._mode = fix_mode
+
+    def flush(self) -> list[WindowSummary]:
+        """
+        Closes the windows still open, e.g. at the end of a log.
+
+        Returns:
+            list[WindowSummary]: All completed window summaries in time order.
+        """
+        if self._panes:
+            # The last reported mode is held until the end of the last pane
+            last_pane = self._panes[-1]
+            self._credit_mode_time(last_pane, (last_pane.index + 1) * self.step)
+        self._close_windows(math.inf)
+        self._mode_since = None
+        return self.completed
+
+    def get_windows(self) -> list[WindowSummary]:
+        return self.completed
+
+    def _credit_mode_time(self, pane: _Pane, until: float) -> None:
+        """
+        Credits the part of the time since the previous sample that falls in `pane`.
+        """
+        if self._mode is None or self._mode_since is None:
+            return
+        overlap = min(until, (pane.index + 1) * self.step) - max(
+            self._mode_since, pane.index * self.step
+        )
+        if overlap <= 0:
+            return
+        pane.mode_time += overlap
+        if self._mode == FixMode.FIX_2D:
+            pane.fix_2d_time += overlap
+        elif self._mode == FixMode.FIX_3D:
+            pane.fix_3d_time += overlap
+
+    def _close_windows(self, limit: float) -> None:
+        """
+        Summarizes, in order, every window with an index below `limit` that holds a
+        sample, dropping the panes no later window needs.
+        """
+        while self._panes:
+            first_window = self._panes[0].index - self._panes_per_window + 1
+            if self._next_window is not None:
+                first_window = max(first_window, self._next_window)
+            if first_window >= limit:
+                break
+
+            end_pane = first_window + self._panes_per_window
+            panes = []
+            for pane in self._panes:
+                if pane.index >= end_pane:
+                    break
+                panes.append(pane)
+            start = round(first_window * self.step, 9)
+            self.completed.append(_summarize(start, start + self.window, panes))
+
+            self._next_window = first_window + 1
+            while self._panes and self._panes[0].index < self._next_window:
+                self._panes.popleft()
+
+    def _advance(self, timestamp: float) -> Optional[_Pane]:
+        """
+        Moves the stream clock to `timestamp`, summarizing the windows that ended
+        before it.
+
+        Returns:
+            Optional[_Pane]: The pane containing `timestamp`, or None if the sample is
+                older than every open window.
+        """
+        # Credit the held fix mode up to now, to the previous sample's pane before it
+        # can be closed and to the pane of this sample
+        previous_pane = self._panes[-1] if self._panes else None
+        if previous_pane is not None:
+            self._credit_mode_time(previous_pane, timestamp)
+        pane = self._find_pane(math.floor(timestamp / self.step))
+        if pane is not None and pane is not previous_pane:
+            self._credit_mode_time(pane, timestamp)
+        if self._mode_since is None or timestamp > self._mode_since:
+            self._mode_since = timestamp
+        return pane
+
+    def _find_pane(self, index: int) -> Optional[_Pane]:
+        """
+        Returns the pane with `index`, opening it (and closing the windows that ended
+        before it) if it is new, or None if it belongs to an already closed window.
+        """
+        if self._panes and self._panes[-1].index == index:
+            return self._panes[-1]
+        self._close_windows(index - self._panes_per_window + 1)
+
+        if not self._panes or self._panes[-1].index < index:
+            if self._next_window is not None and index < self._next_window:
+                return None
+            self._panes.append(_Pane(index))
+            return self._panes[-1]
+
+        # Out of order sample, only kept while its pane is still open
+        for pane in reversed(self._panes):
+            if pane.index == index:
+                return pane
+            if pane.index < index:
+                break
+        return None
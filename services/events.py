@@ -0,0 +1,280 @@
+import json
+from array import array
+from itertools import chain
+from typing import Iterator, Optional
+
+from data_types.events import ChangeEvent, EventKind
+from data_types.nmea import FIX_QUALITIES_WITH_FIX, FixMode, FixQuality, SatelliteStatus
+
+EXPORT_VERSION = 1
+
+# Decimal places of the log timestamps kept by the timestamp encoding
+TIMESTAMP_DECIMALS = 6
+
+IN_VIEW = SatelliteStatus.IN_VIEW.value
+TRACKED = SatelliteStatus.TRACKED.value
+
+# Tokens of the row order encoding: a lone in view row, a lone tracked row, or an in
+# view row directly followed by a tracked row (the steady state of a GGA/GSA stream)
+ORDER_IN_VIEW = "I"
+ORDER_TRACKED = "T"
+ORDER_PAIR = "IT"
+
+
+class RunLengthTimestamps:
+    """
+    Timestamps stored as runs of a constant step: (start, step, count).
+
+    A timestamp only extends the current run if the run reproduces it exactly, so
+    decoding always returns the original values. A receiver logging at a fixed rate
+    produces a single run, irregular timestamps fall back to one run per value.
+    """
+
+    def __init__(self):
+        self.starts = array("d")
+        self.steps = array("d")
+        self.counts = array("L")
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def append(self, timestamp: float) -> None:
+        if self.counts:
+            start, count = self.starts[-1], self.counts[-1]
+            step = (
+                round(timestamp - start, TIMESTAMP_DECIMALS)
+                if count == 1
+                else self.steps[-1]
+            )
+            if round(start + count * step, TIMESTAMP_DECIMALS) == timestamp:
+                self.steps[-1] = step
+                self.counts[-1] = count + 1
+                return
+        self.starts.append(timestamp)
+        self.steps.append(0.0)
+        self.counts.append(1)
+
+    def __iter__(self) -> Iterator[float]:
+        for start, step, count in zip(self.starts, self.steps, self.counts):
+            yield start
+            for i in range(1, count):
+                yield round(start + i * step, TIMESTAMP_DECIMALS)
+
+    def to_list(self) -> list:
+        return [list(run) for run in zip(self.starts, self.steps, self.counts)]
+
+    @classmethod
+    def from_list(cls, runs: list) -> "RunLengthTimestamps":
+        timestamps = cls()
+        for start, step, count in runs:
+            timestamps.starts.append(start)
+            timestamps.steps.append(step)
+            timestamps.counts.append(count)
+        return timestamps
+
+
+class RunLengthValues:
+    """
+    Values stored as (value, count) runs.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.counts = array("L")
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def append(self, value) -> None:
+        if self.counts and self.values[-1] == value:
+            self.counts[-1] += 1
+        else:
+            self.values.append(value)
+            self.counts.append(1)
+
+    def __iter__(self) -> Iterator:
+        for value, count in zip(self.values, self.counts):
+            for _ in range(count):
+                yield value
+
+    def to_list(self) -> list:
+        return [list(run) for run in zip(self.values, self.counts)]
+
+    @classmethod
+    def from_list(cls, runs: list) -> "RunLengthValues":
+        values = cls()
+        for value, count in runs:
+            values.values.append(value)
+            values.counts.append(count)
+        return values
+
+
+class ChangeEventRecorder:
+    def __init__(self):
+        """
+        Event driven alternative to materializing every data row.
+
+        State transitions (satellite count changes, fix acquired/lost, fix mode
+        changes) are kept as `ChangeEvent`s. The rows themselves are run-length encoded:
+        the in view and tracked series each as timestamp and value runs, plus the order
+        in which rows of the two series were produced. Memory and export size grow
+        with the number of changes, not with the capture duration, and `get_data`
+        rebuilds the exact dense row list on demand.
+        """
+        self.events: list[ChangeEvent] = []
+        self.in_view_timestamps = RunLengthTimestamps()
+        self.in_view_counts = RunLengthValues()
+        self.tracked_timestamps = RunLengthTimestamps()
+        self.tracked_counts = RunLengthValues()
+        self.order = RunLengthValues()
+
+        # An in view row waiting to see whether a tracked row pairs with it
+        self._pending_in_view = False
+        self._in_view: Optional[int] = None
+        self._tracked: Optional[int] = None
+        self._has_fix: Optional[bool] = None
+        self._fix_mode: Optional[FixMode] = None
+
+    def __len__(self) -> int:
+        return len(self.in_view_counts) + len(self.tracked_counts)
+
+    def record_row(self, row: tuple[float, str, int]) -> None:
+        """
+        Records a data row as produced by `NMEAParser`, only to rebuild the rows later.
+        Satellite count events come from `record_in_view` and `record_tracked`, since
+        the rows skip GSA samples that do not change the plot.
+        """
+        timestamp, sat_type, count = row
+        if sat_type == IN_VIEW:
+            if self._pending_in_view:
+                self.order.append(ORDER_IN_VIEW)
+            self._pending_in_view = True
+            self.in_view_timestamps.append(timestamp)
+            self.in_view_counts.append(count)
+        else:
+            if self._pending_in_view:
+                self.order.append(ORDER_PAIR)
+                self._pending_in_view = False
+            else:
+                self.order.append(ORDER_TRACKED)
+            self.tracked_timestamps.append(timestamp)
+            self.tracked_counts.append(count)
+
+    def record_in_view(self, timestamp: float, count: int) -> None:
+        """
+        Emits IN_VIEW_CHANGED when a GGA satellite count differs from the previous one.
+        """
+        if count != self._in_view:
+            self._emit(timestamp, EventKind.IN_VIEW_CHANGED, self._in_view, count)
+            self._in_view = count
+
+    def record_tracked(self, timestamp: float, count: int) -> None:
+        """
+        Emits TRACKED_CHANGED when a GSA satellite count differs from the previous one.
+        """
+        if count != self._tracked:
+            self._emit(timestamp, EventKind.TRACKED_CHANGED, self._tracked, count)
+            self._tracked = count
+
+    def record_fix_quality(self, timestamp: float, fix_quality: FixQuality) -> None:
+        """
+        Emits FIX_ACQUIRED or FIX_LOST when a GGA fix quality crosses "No Fix". A
+        capture starting without a fix emits nothing until the first fix.
+        """
+        has_fix = fix_quality in FIX_QUALITIES_WITH_FIX
+        if has_fix == bool(self._has_fix):
+            self._has_fix = has_fix
+            return
+        kind = EventKind.FIX_ACQUIRED if has_fix else EventKind.FIX_LOST
+        old = None if self._has_fix is None else not has_fix
+        self._emit(timestamp, kind, old, has_fix)
+        self._has_fix = has_fix
+
+    def record_fix_mode(self, timestamp: float, fix_mode: FixMode) -> None:
+        """
+        Emits MODE_CHANGED when a GSA fix mode differs from the previous one.
+        """
+        if fix_mode == self._fix_mode:
+            return
+        old = None if self._fix_mode is None else self._fix_mode.name
+        self._emit(timestamp, EventKind.MODE_CHANGED, old, fix_mode.name)
+        self._fix_mode = fix_mode
+
+    def _emit(self, timestamp: float, kind: EventKind, old, new) -> None:
+        self.events.append(ChangeEvent(timestamp, kind, old, new))
+
+    def get_events(self) -> list[ChangeEvent]:
+        return self.events
+
+    def iter_data(self) -> Iterator[tuple[float, str, int]]:
+        """
+        Rebuilds the dense data rows, in their original order, one at a time.
+        """
+        in_view_rows = zip(self.in_view_timestamps, self.in_view_counts)
+        tracked_rows = zip(self.tracked_timestamps, self.tracked_counts)
+        order = chain(self.order, [ORDER_IN_VIEW] if self._pending_in_view else [])
+        for token in order:
+            if token != ORDER_TRACKED:
+                timestamp, count = next(in_view_rows)
+                yield (timestamp, IN_VIEW, count)
+            if token != ORDER_IN_VIEW:
+                timestamp, count = next(tracked_rows)
+                yield (timestamp, TRACKED, count)
+
+    def get_data(self) -> list[tuple[float, str, int]]:
+        return list(self.iter_data())
+
+    def to_dict(self) -> dict:
+        order = RunLengthValues.from_list(self.order.to_list())
+        if self._pending_in_view:
+            order.append(ORDER_IN_VIEW)
+        return {
+            "version": EXPORT_VERSION,
+            "events": [
+                [event.timestamp, event.kind.value, event.old, event.new]
+                for event in self.events
+            ],
+            "in_view": {
+                "timestamps": self.in_view_timestamps.to_list(),
+                "counts": self.in_view_counts.to_list(),
+            },
+            "tracked": {
+                "timestamps": self.tracked_timestamps.to_list(),
+                "counts": self.tracked_counts.to_list(),
+            },
+            "order": order.to_list(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChangeEventRecorder":
+        """
+        Restores a recorder from `to_dict` output, e.g. to rebuild the dense rows of an
+        exported capture.
+        """
+        if data.get("version") != EXPORT_VERSION:
+            raise ValueError(f"Unsupported event export version: {data.get('version')}")
+
+        recorder = cls()
+        recorder.events = [
+            ChangeEvent(timestamp, EventKind(kind), old, new)
+            for timestamp, kind, old, new in data["events"]
+        ]
+        recorder.in_view_timestamps = RunLengthTimestamps.from_list(
+            data["in_view"]["timestamps"]
+        )
+        recorder.in_view_counts = RunLengthValues.from_list(data["in_view"]["counts"])
+        recorder.tracked_timestamps = RunLengthTimestamps.from_list(
+            data["tracked"]["timestamps"]
+        )
+        recorder.tracked_counts = RunLengthValues.from_list(data["tracked"]["counts"])
+        recorder.order = RunLengthValues.from_list(data["order"])
+        return recorder
+
+    def export(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, path: str) -> "ChangeEventRecorder":
+        with open(path, "r") as file:
+            return cls.from_dict(json.load(file))
@@ -0,0 +1,44 @@
+import math
+from collections import deque
+
+
+class LatencyTracker:
+    def __init__(self, max_samples: int = 100000):
+        """
+        Records latencies and reports percentiles over the most recent `max_samples`.
+
+        Args:
+            max_samples (int, optional): Number of latest samples kept. Defaults to 100000.
+        """
+        self.count = 0
+        self.max_latency = 0.0
+        self._samples = deque(maxlen=max_samples)
+
+    def record(self, latency: float) -> None:
+        self.count += 1
+        if latency > self.max_latency:
+            self.max_latency = latency
+        self._samples.append(latency)
+
+    def percentiles(self, percents: tuple = (50, 95, 99)) -> dict[float, float]:
+        """
+        Computes nearest-rank percentiles of the kept samples.
+
+        Returns:
+            dict[float, float]: Latency in seconds per requested percent, empty if no
+                sample was recorded.
+        """
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        return {
+            percent: samples[max(0, math.ceil(percent / 100 * len(samples)) - 1)]
+            for percent in percents
+        }
+
+    def summary(self) -> str:
+        latencies = ", ".join(
+            f"p{percent:g}={latency * 1000:.1f} ms"
+            for percent, latency in self.percentiles().items()
+        )
+        return f"{latencies}, max={self.max_latency * 1000:.1f} ms over {self.count} samples"
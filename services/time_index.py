@@ -0,0 +1,149 @@
+import json
+import os
+from bisect import bisect_left
+from typing import Callable, Optional
+
+from utils.log_reader import list_members
+
+INDEX_VERSION = 3
+INDEX_SUFFIX = ".idx"
+
+
+class TimeIndex:
+    def __init__(self, every_lines: int = 10000, every_seconds: float = None):
+        """
+        Sparse index of a log file mapping timestamps to byte offsets and parser state.
+
+        While a log is parsed a checkpoint is stored every `every_lines` lines and, if
+        set, every `every_seconds` seconds of log time. Each checkpoint holds the
+        timestamp and byte offset of a line plus a snapshot of the parser state right
+        before that line, so parsing can resume there as if the file had been parsed
+        from the start. Offsets refer to the decompressed content for compressed logs,
+        and the members of a compressed log (gzip members, bzip2/xz streams, zstd
+        frames) are recorded so that resuming only decompresses from the member holding
+        the checkpoint.
+
+        Args:
+            every_lines (int, optional): Lines between checkpoints. Defaults to 10000.
+            every_seconds (float, optional): Log seconds between checkpoints. Defaults to
+                None (line based only).
+        """
+        self.every_lines = every_lines
+        self.every_seconds = every_seconds
+        self.timestamps: list[float] = []
+        self.entries: list[tuple[int, dict]] = []  # (byte offset, parser state)
+        # (compressed offset, decompressed offset) of each member of a compressed log
+        self.members: list[tuple[int, int]] = []
+        self.source_size = None
+        self.source_mtime_ns = None
+
+        self._last_line = 0
+        self._last_timestamp = None
+
+    @staticmethod
+    def index_path(input_file: str) -> str:
+        return f"{input_file}{INDEX_SUFFIX}"
+
+    def start(self, input_file: str) -> None:
+        """
+        Clears the checkpoints and records the size, modification time and members of
+        the log about to be indexed.
+        """
+        stat = os.stat(input_file)
+        self.source_size = stat.st_size
+        self.source_mtime_ns = stat.st_mtime_ns
+        self.timestamps = []
+        self.entries = []
+        self.members = list_members(input_file)
+        self._last_line = 0
+        self._last_timestamp = None
+
+    def checkpoint(
+        self,
+        timestamp: float,
+        offset: int,
+        line_number: int,
+        get_state: Callable[[], dict],
+    ) -> None:
+        """
+        Stores a checkpoint for the line at `offset` if one is due. `get_state` is only
+        called when a checkpoint is stored.
+        """
+        if self._last_timestamp is None:
+            self._last_timestamp = timestamp
+
+        due = line_number - self._last_line >= self.every_lines
+        if not due and self.every_seconds:
+            due = timestamp - self._last_timestamp >= self.every_seconds
+        if not due:
+            return
+
+        self.timestamps.append(timestamp)
+        self.entries.append((offset, get_state()))
+        self._last_line = line_number
+        self._last_timestamp = timestamp
+
+    def lookup(self, start: float) -> Optional[tuple[int, dict]]:
+        """
+        Finds the last checkpoint strictly before `start`, so that every line at or after
+        `start` follows it in the file. Timestamps are assumed to increase through the log.
+
+        Returns:
+            Optional[tuple[int, dict]]: The (byte offset, parser state) to resume from, or
+                None to parse from the beginning of the file.
+        """
+        position = bisect_left(self.timestamps, start) - 1
+        if position < 0:
+            return None
+        return self.entries[position]
+
+    def is_current(self, input_file: str) -> bool:
+        """
+        Checks the index was built from the log as it is now on disk.
+        """
+        stat = os.stat(input_file)
+        return (
+            stat.st_size == self.source_size
+            and stat.st_mtime_ns == self.source_mtime_ns
+        )
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    "version": INDEX_VERSION,
+                    "every_lines": self.every_lines,
+                    "every_seconds": self.every_seconds,
+                    "source_size": self.source_size,
+                    "source_mtime_ns": self.source_mtime_ns,
+                    "timestamps": self.timestamps,
+                    "entries": self.entries,
+                    "members": self.members,
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["TimeIndex"]:
+        """
+        Loads an index saved with `save`.
+
+        Returns:
+            Optional[TimeIndex]: The index, or None if the file is missing, unreadable or
+                was written by another index version.
+        """
+        try:
+            with open(path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION:
+            return None
+
+        index = cls(data["every_lines"], data["every_seconds"])
+        index.source_size = data["source_size"]
+        index.source_mtime_ns = data["source_mtime_ns"]
+        index.timestamps = data["timestamps"]
+        index.entries = [(offset, state) for offset, state in data["entries"]]
+        index.members = [tuple(member) for member in data["members"]]
+        return index
@@ -0,0 +1,75 @@
+import bz2
+import gzip
+import lzma
+from pathlib import Path
+
+import pytest
+
+SAMPLE_LOG = Path(__file__).resolve().parent.parent / "assets" / "stce_nmea_log.txt"
+
+# Log seconds between the repeated copies of the sample log in `long_log`
+SAMPLE_PERIOD = 30
+
+EXTENSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}
+
+
+def _compress(content: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(content)
+    if compression == "bz2":
+        return bz2.compress(content)
+    if compression == "xz":
+        return lzma.compress(content)
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(content)
+
+
+@pytest.fixture(scope="session")
+def write_compressed():
+    """
+    Returns a function writing a compressed copy of a log next to it, made of
+    `members` independently compressed parts (gzip members, bzip2/xz streams, zstd
+    frames), and returning its path. "none" returns the log itself.
+    """
+
+    def write(source: Path, compression: str, members: int = 1) -> Path:
+        if compression == "none":
+            return source
+        content = source.read_bytes()
+        suffix = "" if members == 1 else f".{members}"
+        path = source.with_name(f"{source.name}{suffix}{EXTENSIONS[compression]}")
+        part_size = -(-len(content) // members)
+        path.write_bytes(
+            b"".join(
+                _compress(content[start : start + part_size], compression)
+                for start in range(0, len(content), part_size)
+            )
+        )
+        return path
+
+    return write
+
+
+@pytest.fixture(scope="session")
+def sample_log() -> Path:
+    return SAMPLE_LOG
+
+
+@pytest.fixture(scope="session")
+def long_log(tmp_path_factory) -> Path:
+    """
+    The sample log repeated 100 times, each copy shifted `SAMPLE_PERIOD` seconds
+    later, so the timestamps keep increasing through the file.
+    """
+    lines = []
+    for line in SAMPLE_LOG.read_text().splitlines():
+        timestamp, sentence = line[len("t=") :].split(" ", 1)
+        lines.append((float(timestamp.rstrip(",")), sentence))
+
+    path = tmp_path_factory.mktemp("logs") / "long_log.txt"
+    with open(path, "w") as file:
+        for copy in range(100):
+            for timestamp, sentence in lines:
+                shifted = round(timestamp + copy * SAMPLE_PERIOD, 1)
+                file.write(f"t={shifted}, {sentence}\n")
+    return path
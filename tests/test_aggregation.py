@@ -0,0 +1,132 @@
+import math
+import random
+
+import pytest
+
+from data_types.nmea import FIX_QUALITIES_WITH_FIX, FixMode, FixQuality
+from services.aggregation import WindowedAggregator
+
+
+def _samples(seed: int) -> list[tuple]:
+    """
+    A stream of ("in_view"|"tracked"|"mode", timestamp, value) samples, a few per
+    second so that every one second pane holds samples.
+    """
+    rng = random.Random(seed)
+    samples = []
+    timestamp = 3.0
+    while timestamp < 120:
+        timestamp = round(timestamp + rng.choice((0.1, 0.2, 0.25, 0.3)), 2)
+        kind = rng.choice(("in_view", "tracked", "mode"))
+        if kind == "in_view":
+            value = (rng.randint(0, 14), rng.choice(list(FixQuality)))
+        elif kind == "tracked":
+            value = rng.randint(0, 12)
+        else:
+            value = rng.choice(list(FixMode))
+        samples.append((kind, timestamp, value))
+    return samples
+
+
+def _aggregate(samples, window, step):
+    aggregator = WindowedAggregator(window, step)
+    for kind, timestamp, value in samples:
+        if kind == "in_view":
+            aggregator.add_in_view(timestamp, *value)
+        elif kind == "tracked":
+            aggregator.add_tracked(timestamp, value)
+        else:
+            aggregator.add_fix_mode(timestamp, value)
+    return aggregator.flush()
+
+
+def _mode_time(samples, start, end, step):
+    """
+    Seconds of [start, end) with a known fix mode, and of them in 2D and 3D, holding
+    each reported mode until the next one and the last until the end of its pane.
+    """
+    modes = [(t, mode) for kind, t, mode in samples if kind == "mode"]
+    stream_end = (math.floor(samples[-1][1] / step) + 1) * step
+    bounds = [t for t, _ in modes[1:]] + [stream_end]
+    total = fix_2d = fix_3d = 0.0
+    for (since, mode), until in zip(modes, bounds):
+        overlap = max(0.0, min(until, end) - max(since, start))
+        total += overlap
+        if mode == FixMode.FIX_2D:
+            fix_2d += overlap
+        elif mode == FixMode.FIX_3D:
+            fix_3d += overlap
+    return total, fix_2d, fix_3d
+
+
+def _brute_force(samples, window, step):
+    """
+    Recomputes every window from scratch over the samples it contains.
+    """
+    panes_per_window = round(window / step)
+    window_indexes = sorted(
+        {
+            math.floor(t / step) - offset
+            for _, t, _ in samples
+            for offset in range(panes_per_window)
+        }
+    )
+
+    windows = []
+    for index in window_indexes:
+        start = index * step
+        end = start + window
+        inside = [(kind, value) for kind, t, value in samples if start <= t < end]
+        in_view = [value[0] for kind, value in inside if kind == "in_view"]
+        qualities = [value[1] for kind, value in inside if kind == "in_view"]
+        tracked = [value for kind, value in inside if kind == "tracked"]
+        total, fix_2d, fix_3d = _mode_time(samples, start, end, step)
+        windows.append(
+            {
+                "start": start,
+                "in_view_mean": sum(in_view) / len(in_view) if in_view else None,
+                "in_view_min": min(in_view, default=None),
+                "in_view_max": max(in_view, default=None),
+                "tracked_mean": sum(tracked) / len(tracked) if tracked else None,
+                "tracked_min": min(tracked, default=None),
+                "tracked_max": max(tracked, default=None),
+                "fix_availability": (
+                    100
+                    * sum(q in FIX_QUALITIES_WITH_FIX for q in qualities)
+                    / len(qualities)
+                    if qualities
+                    else None
+                ),
+                "fix_2d_share": 100 * fix_2d / total if total else None,
+                "fix_3d_share": 100 * fix_3d / total if total else None,
+            }
+        )
+    return windows
+
+
+@pytest.mark.parametrize("window, step", [(10, None), (10, 1), (6, 2), (5, 5)])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_windows_match_brute_force(seed, window, step):
+    samples = _samples(seed)
+    summaries = _aggregate(samples, window, step)
+    expected = _brute_force(samples, window, step or window)
+
+    assert len(summaries) == len(expected)
+    for summary, reference in zip(summaries, expected):
+        assert summary.start == pytest.approx(reference["start"])
+        assert summary.end == pytest.approx(reference["start"] + window)
+        for field, value in reference.items():
+            if field == "start":
+                continue
+            actual = getattr(summary, field)
+            if value is None:
+                assert actual is None, field
+            else:
+                assert actual == pytest.approx(value, abs=0.01), field
+
+
+def test_window_must_be_a_multiple_of_the_step():
+    with pytest.raises(ValueError):
+        WindowedAggregator(10, 3)
+    with pytest.raises(ValueError):
+        WindowedAggregator(5, 10)
@@ -0,0 +1,71 @@
+import csv
+import shutil
+
+import pytest
+
+from parsers.gpgsa_parser import GPGSAParser
+from utils.campaign_processor import CampaignProcessor
+
+
+@pytest.fixture
+def campaign_dir(tmp_path, sample_log):
+    logs = tmp_path / "logs"
+    logs.mkdir()
+    shutil.copy(sample_log, logs / "a.txt")
+    shutil.copy(sample_log, logs / "b.txt")
+    (logs / "broken.gz").write_bytes(b"\x1f\x8bnot really gzip")
+    # Written next to the logs by the other commands, never summarized
+    (logs / "a.txt.idx").write_text("{}")
+    (logs / "events.json").write_text("{}")
+    return logs
+
+
+def _read_rows(path):
+    with open(path, newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def test_summary_counts_every_gsa_sentence(campaign_dir, tmp_path, sample_log):
+    output = tmp_path / "summary.csv"
+    rows = CampaignProcessor(str(campaign_dir), str(output), workers=1).process()
+
+    parser = GPGSAParser()
+    tracked = [
+        parser.parse(0, line[line.index("$") :].split(",")).num_satellites_tracked
+        for line in sample_log.read_text().splitlines()
+        if "$GPGSA" in line
+    ]
+    assert sorted(row["file"].rsplit("/", 1)[1] for row in rows) == ["a.txt", "b.txt"]
+    for row in rows:
+        assert row["tracked_mean"] == round(sum(tracked) / len(tracked), 2)
+        assert row["tracked_max"] == max(tracked)
+
+
+def test_reruns_keep_one_error_row_per_failed_file(campaign_dir, tmp_path):
+    output = tmp_path / "summary.csv"
+    for _ in range(3):
+        CampaignProcessor(str(campaign_dir), str(output), workers=1).process()
+
+    rows = _read_rows(output)
+    assert sorted(row["file"].rsplit("/", 1)[1] for row in rows) == [
+        "a.txt",
+        "b.txt",
+        "broken.gz",
+    ]
+    assert [row["error"] != "" for row in rows].count(True) == 1
+
+
+def test_interrupted_row_is_redone(campaign_dir, tmp_path):
+    (campaign_dir / "broken.gz").unlink()
+    output = tmp_path / "summary.csv"
+    CampaignProcessor(str(campaign_dir), str(output), workers=1).process()
+    complete = _read_rows(output)
+
+    # Cut the last row short, as an interruption while writing it would
+    output.write_bytes(output.read_bytes()[:-8])
+    processor = CampaignProcessor(str(campaign_dir), str(output), workers=1)
+    assert len(processor.load_completed_rows()) == 1
+    processor.process()
+
+    assert _read_rows(output) == complete
+    assert output.read_bytes().endswith(b"\r\n")
@@ -0,0 +1,78 @@
+import random
+
+from data_types.events import EventKind
+from parsers.nmea_parser import NMEAParser
+from services.events import ChangeEventRecorder, RunLengthTimestamps
+
+
+def test_event_mode_rebuilds_the_dense_rows(long_log, tmp_path):
+    dense = NMEAParser()
+    dense.parse_log_file(str(long_log))
+    events = NMEAParser(record_events=True)
+    events.parse_log_file(str(long_log))
+
+    assert events.data == []
+    assert events.get_data() == dense.get_data()
+    assert list(events.iter_data()) == dense.get_data()
+    assert events.get_ttff() == dense.get_ttff()
+
+    export_file = tmp_path / "events.json"
+    events.event_recorder.export(str(export_file))
+    loaded = ChangeEventRecorder.load(str(export_file))
+    assert loaded.get_data() == dense.get_data()
+    assert loaded.get_events() == events.get_events()
+
+
+def test_events_follow_state_transitions(long_log):
+    parser = NMEAParser(record_events=True)
+    parser.parse_log_file(str(long_log))
+    kinds = [event.kind for event in parser.get_events()]
+
+    # Every copy of the sample log starts without a fix and acquires one. The capture
+    # starts without a fix, so only the 99 later copies lose one
+    assert kinds.count(EventKind.FIX_ACQUIRED) == 100
+    assert kinds.count(EventKind.FIX_LOST) == 99
+    assert kinds.index(EventKind.FIX_ACQUIRED) < kinds.index(EventKind.FIX_LOST)
+    assert EventKind.MODE_CHANGED in kinds
+    for event in parser.get_events():
+        assert event.old != event.new
+
+
+def test_tracked_events_include_gsa_samples_skipped_by_the_rows():
+    gga = "$GPGGA,040438.00,3750.37,N,12214.84,W,1,08,1.2,26.4,M,,M,,*62"
+    parser = NMEAParser(record_events=True)
+    for second, tracked in enumerate((6, 8, 3), start=1):
+        satellites = ["01"] * tracked + [""] * (12 - tracked)
+        parser.parse_nmea(float(second), gga)
+        parser.parse_nmea(
+            second + 0.1, f"$GPGSA,A,3,{','.join(satellites)},1.5,1.2,1.0"
+        )
+
+    # The row for 8 tracked is skipped, since 8 are in view, but still changes the count
+    assert (2.1, "tracked", 8) not in parser.get_data()
+    changes = [
+        (event.old, event.new)
+        for event in parser.get_events()
+        if event.kind == EventKind.TRACKED_CHANGED
+    ]
+    assert changes == [(None, 6), (6, 8), (8, 3)]
+
+
+def test_run_length_timestamps_are_exact():
+    rng = random.Random(7)
+    values = []
+    timestamp = 0.0
+    for _ in range(2000):
+        # Long regular stretches mixed with irregular jumps
+        step = rng.choice((0.1, 0.1, 0.1, 1.0, rng.uniform(0, 5)))
+        timestamp = round(timestamp + step, rng.choice((1, 3, 6)))
+        values.append(timestamp)
+
+    timestamps = RunLengthTimestamps()
+    for value in values:
+        timestamps.append(value)
+
+    assert list(timestamps) == values
+    assert len(timestamps) == len(values)
+    assert list(RunLengthTimestamps.from_list(timestamps.to_list())) == values
+    assert len(timestamps.counts) < len(values)
@@ -0,0 +1,91 @@
+import lzma
+import shutil
+
+import pytest
+
+from parsers.nmea_parser import NMEAParser
+from utils.log_reader import detect_compression, list_members, open_log, open_log_at
+
+COMPRESSIONS = ["gzip", "bz2", "xz", "zstd"]
+
+
+@pytest.fixture(scope="module")
+def plain_parse(long_log):
+    parser = NMEAParser()
+    parser.parse_log_file(str(long_log))
+    return list(parser.get_data()), parser.get_ttff()
+
+
+@pytest.mark.parametrize("members", [1, 5])
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_compressed_logs_parse_like_plain_text(
+    long_log, plain_parse, write_compressed, compression, members
+):
+    path = write_compressed(long_log, compression, members)
+    parser = NMEAParser()
+    parser.parse_log_file(str(path))
+
+    assert (parser.get_data(), parser.get_ttff()) == plain_parse
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_compression_is_detected_from_magic_bytes(
+    long_log, tmp_path, write_compressed, compression
+):
+    misnamed = tmp_path / "capture.txt"
+    shutil.copy(write_compressed(long_log, compression), misnamed)
+
+    assert detect_compression(str(misnamed)) == compression
+    with open_log(str(misnamed)) as file:
+        assert file.read() == long_log.read_text()
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_members_allow_decompressing_from_any_offset(
+    long_log, write_compressed, compression
+):
+    content = long_log.read_bytes()
+    path = str(write_compressed(long_log, compression, 5))
+    members = list_members(path)
+
+    part_size = -(-len(content) // 5)
+    assert [start for _, start in members] == [i * part_size for i in range(5)]
+    assert all(a[0] < b[0] for a, b in zip(members, members[1:]))
+
+    for offset in (0, 1, part_size - 1, part_size, 3 * part_size + 17, len(content)):
+        with open_log_at(path, offset, members) as file:
+            assert file.read() == content[offset:]
+
+
+def test_padding_between_members_is_skipped(long_log, tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+
+    content = long_log.read_bytes()
+    half = len(content) // 2
+    skippable = (
+        (0x184D2A53).to_bytes(4, "little") + (5).to_bytes(4, "little") + b"meta!"
+    )
+
+    zstd_path = tmp_path / "padded.zst"
+    compressor = zstandard.ZstdCompressor()
+    zstd_path.write_bytes(
+        compressor.compress(content[:half])
+        + skippable
+        + compressor.compress(content[half:])
+    )
+    xz_path = tmp_path / "padded.xz"
+    xz_path.write_bytes(
+        lzma.compress(content[:half]) + b"\0" * 8 + lzma.compress(content[half:])
+    )
+
+    for path in (zstd_path, xz_path):
+        members = list_members(str(path))
+        assert [start for _, start in members] == [0, half]
+        with open_log_at(str(path), half + 3, members) as file:
+            assert file.read() == content[half + 3 :]
+
+
+def test_plain_logs_have_no_members(long_log):
+    assert list_members(str(long_log)) == []
+    with open_log_at(str(long_log), 10) as file:
+        assert file.read() == long_log.read_bytes()[10:]
@@ -0,0 +1,55 @@
+import pytest
+
+from data_types.nmea import DataStatus, FixMode, FixQuality
+from data_types.records import GGARecord, GSARecord, RMCRecord
+from parsers.gngsa_parser import GNGSAParser
+from parsers.gpgga_parser import GPGGAParser
+from parsers.gpgsa_parser import GPGSAParser
+from parsers.gprmc_parser import GPRMCParser
+
+
+def _fields(sentence: str) -> list[str]:
+    return sentence.split(",")
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [(str(quality.value), quality) for quality in FixQuality if quality >= 0]
+    + [("9", FixQuality.UNKNOWN), ("", FixQuality.UNKNOWN)],
+)
+def test_gga_fix_quality_codes(code, expected):
+    fields = _fields(
+        f"$GPGGA,040438.00,3750.37,N,12214.84,W,{code},07,1.2,26.4,M,,M,,*62"
+    )
+    record = GPGGAParser().parse(1.0, fields)
+    assert record == GGARecord(1.0, expected, 7)
+    assert type(record.fix_quality) is FixQuality
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ("", FixMode.NO_MODE),
+        ("1", FixMode.NO_FIX),
+        ("2", FixMode.FIX_2D),
+        ("3", FixMode.FIX_3D),
+        ("7", None),
+    ],
+)
+def test_gsa_fix_mode_codes(code, expected):
+    sentence = f"GSA,A,{code},02,12,17,24,,,,,,,,,1.5,1.2,1.0*19"
+    gpgsa = GPGSAParser().parse(2.0, _fields(f"$GP{sentence}"))
+    gngsa = GNGSAParser().parse(2.0, _fields(f"$GN{sentence}"))
+
+    # Both talkers map the mode the same way, unknown codes included
+    assert gpgsa == GSARecord(2.0, expected, 4)
+    assert gngsa == GSARecord(2.0, expected, None)
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [("A", DataStatus.VALID), ("V", DataStatus.INVALID), ("X", None)],
+)
+def test_rmc_status_codes(code, expected):
+    fields = _fields(f"$GPRMC,040438.00,{code},3750.37,N,12214.84,W,0.2,,291221,,,A*4B")
+    assert GPRMCParser().parse(3.0, fields) == RMCRecord(3.0, expected)
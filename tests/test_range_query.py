@@ -0,0 +1,51 @@
+import pytest
+
+from parsers.nmea_parser import NMEAParser
+from services.time_index import TimeIndex
+from utils.range_query import RangeQueryProcessor
+
+
+@pytest.fixture(scope="module")
+def full_parse(long_log):
+    parser = NMEAParser()
+    parser.parse_log_file(str(long_log))
+    return list(parser.get_data())
+
+
+@pytest.mark.parametrize("members", [1, 7])
+@pytest.mark.parametrize("compression", ["none", "gzip", "bz2", "xz", "zstd"])
+def test_range_query_matches_full_parse(
+    long_log, full_parse, write_compressed, compression, members
+):
+    input_file = str(write_compressed(long_log, compression, members))
+
+    for _ in range(2):  # The index is built by the first pass and loaded by the second
+        processor = RangeQueryProcessor(input_file, every_lines=200)
+        for start, end in ((0, 50), (17.5, 23.1), (1234.5, 1300), (2950, 4000)):
+            expected = [row for row in full_parse if start <= row[0] <= end]
+            assert processor.query(start, end) == expected
+
+
+def test_time_based_checkpoints_resume_exactly(long_log, full_parse):
+    index = TimeIndex(every_lines=10**9, every_seconds=45)
+    NMEAParser().parse_log_file(str(long_log), index)
+    assert len(index.entries) > 10
+
+    parser = NMEAParser()
+    for start, end in ((0, 10), (44.9, 46), (600, 725.5), (2999, 3100)):
+        expected = [row for row in full_parse if start <= row[0] <= end]
+        assert parser.parse_log_range(str(long_log), start, end, index) == expected
+
+
+def test_query_works_when_the_index_cannot_be_saved(
+    long_log, full_parse, monkeypatch, tmp_path
+):
+    def read_only(self, path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(TimeIndex, "save", read_only)
+    processor = RangeQueryProcessor(str(long_log), every_lines=200)
+    processor.index_file = str(tmp_path / "missing.idx")
+
+    expected = [row for row in full_parse if 100 <= row[0] <= 160]
+    assert processor.query(100, 160) == expected
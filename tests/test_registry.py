@@ -0,0 +1,121 @@
+import pytest
+
+from parsers import registry
+from parsers.base_parser import BaseNMEAParser
+from parsers.nmea_parser import NMEAParser
+from parsers.registry import register_parser
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Keeps parsers registered by a test out of the other tests."""
+    monkeypatch.setattr(registry, "_registry", dict(registry._registry))
+
+
+class _EntryPoint:
+    def __init__(self, name, load):
+        self.name = name
+        self.load = load
+
+
+class _EntryPoints(list):
+    def select(self, group):
+        return self if group == registry.ENTRY_POINT_GROUP else []
+
+
+def test_registered_parser_records_reach_the_sinks():
+    @register_parser("GPVTG", fields=(1, 7))
+    class GPVTGParser(BaseNMEAParser):
+        def parse(self, timestamp, fields):
+            return {"timestamp": timestamp, "course": fields[1], "speed": fields[7]}
+
+    parser = NMEAParser()
+    records = []
+    parser.add_record_sink("GPVTG", records.append)
+    parser.parse_sentence("t=1.5, $GPVTG,054.7,T,034.4,M,005.5,N,010.2,K*48")
+
+    assert "GPVTG" in registry.get_registered_sentences()
+    assert records == [{"timestamp": 1.5, "course": "054.7", "speed": "010.2"}]
+
+
+def test_fields_are_split_only_up_to_the_highest_field_read():
+    received = []
+
+    @register_parser("PTEST", fields=(1, 3))
+    class PTestParser(BaseNMEAParser):
+        def parse(self, timestamp, fields):
+            received.append(fields)
+            return fields
+
+    parser = NMEAParser()
+    parser.add_record_sink("PTEST", lambda record: None)
+    parser.parse_sentence("t=2, $PTEST,a,b,c,d,e*00")
+
+    # fields[3] is free of the line tail, which stays unsplit in the last field
+    assert received == [["$PTEST", "a", "b", "c", "d,e*00"]]
+
+
+def test_sentences_without_consumer_are_not_parsed():
+    calls = []
+
+    @register_parser("PIDLE")
+    class PIdleParser(BaseNMEAParser):
+        def parse(self, timestamp, fields):
+            calls.append(fields)
+            return fields
+
+    NMEAParser().parse_sentence("t=3, $PIDLE,1,2*00")
+    assert calls == []
+    with pytest.raises(KeyError):
+        NMEAParser().add_record_sink("PNONE", print)
+
+
+def test_entry_point_parsers_are_loaded_once(monkeypatch):
+    loads = []
+
+    def load_parser_module():
+        loads.append("ok")
+
+        @register_parser("PUBX")
+        class PUBXParser(BaseNMEAParser):
+            def parse(self, timestamp, fields):
+                return fields
+
+    def broken_module():
+        raise ImportError("missing dependency")
+
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+    monkeypatch.setattr(
+        registry,
+        "entry_points",
+        lambda: _EntryPoints(
+            [
+                _EntryPoint("broken", broken_module),
+                _EntryPoint("pubx", load_parser_module),
+            ]
+        ),
+    )
+
+    NMEAParser()
+    NMEAParser()
+
+    # A failing entry point is logged and skipped, the others still register
+    assert loads == ["ok"]
+    assert "PUBX" in registry.get_registered_sentences()
+
+
+def test_gpgsv_records_use_the_tagged_framing():
+    parser = NMEAParser()
+    records = []
+    parser.add_record_sink("GPGSV", records.append)
+    parser.parse_sentence(
+        "t=4, $GPGSV,3,1,11,03,03,111,00,04,15,270,00,06,01,010,00,13,06,292,00*74"
+    )
+    parser.parse_sentence(
+        "t=5, $GPGSV,3,3,11,22,42,067,42,24,14,311,43,27,05,244,00*4D"
+    )
+
+    assert [tuple(record[1:]) for record in records] == [
+        (3, 1, 11, ["03", "04", "06", "13"]),
+        (3, 3, 11, ["22", "24", "27"]),
+    ]
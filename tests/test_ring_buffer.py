@@ -0,0 +1,25 @@
+import threading
+
+from utils.ring_buffer import RingBuffer
+
+
+def test_full_buffer_drops_and_counts_overflows():
+    buffer = RingBuffer(3)
+    assert [buffer.put(i) for i in range(5)] == [True, True, True, False, False]
+    assert buffer.overflows == 2
+    assert buffer.high_watermark == 3
+    assert buffer.get_all() == [0, 1, 2]
+    assert buffer.get(timeout=0) is None
+
+
+def test_close_wakes_up_a_waiting_consumer():
+    buffer = RingBuffer(3)
+    received = []
+    consumer = threading.Thread(target=lambda: received.append(buffer.get(10)))
+    consumer.start()
+    buffer.close()
+    consumer.join(timeout=5)
+
+    assert not consumer.is_alive()
+    assert received == [None]
+    assert buffer.closed
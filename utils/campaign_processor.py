@@ -0,0 +1,222 @@
+import csv
+import glob
+import logging
+import os
+from multiprocessing import Pool
+from pathlib import Path
+from statistics import mean
+from typing import Optional
+
+from parsers.nmea_parser import NMEAParser
+from services.time_index import INDEX_SUFFIX
+from utils.logger import Logger
+
+SUMMARY_COLUMNS = [
+    "file",
+    "ttff",
+    "fix_availability",
+    "in_view_mean",
+    "in_view_max",
+    "tracked_mean",
+    "tracked_max",
+    "samples",
+    "error",
+]
+
+# Files written next to the logs by the other commands (time indexes, event exports,
+# summaries), never picked up as logs
+IGNORED_SUFFIXES = (INDEX_SUFFIX, ".json", ".csv")
+
+# One parser per worker process, created by `_init_worker` and reset between files
+_worker_parser: Optional[NMEAParser] = None
+
+
+def _init_worker():
+    global _worker_parser
+    _worker_parser = NMEAParser()
+    # Per-file TTFF messages from every worker would drown the campaign output
+    _worker_parser.logger.set_log_level(logging.WARNING)
+
+
+def _summarize_file(input_file: str) -> dict:
+    """
+    Parses one log with the worker's parser and returns its summary row.
+
+    Args:
+        input_file (str): Path to the NMEA log file.
+
+    Returns:
+        dict: Summary row keyed by `SUMMARY_COLUMNS`. Parsing errors are reported in
+            the 'error' column instead of being raised, so one bad file does not stop
+            the campaign.
+    """
+    row = dict.fromkeys(SUMMARY_COLUMNS, "")
+    row["file"] = input_file
+
+    try:
+        _worker_parser.reset()
+        _worker_parser.parse_log_file(input_file)
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+        return row
+
+    stats = _worker_parser.get_satellite_stats()
+    ttff = _worker_parser.get_ttff()
+    fix_availability = _worker_parser.get_fix_availability()
+    row["ttff"] = "" if ttff is None else ttff
+    row["fix_availability"] = "" if fix_availability is None else fix_availability
+    for column in ("in_view_mean", "in_view_max", "tracked_mean", "tracked_max"):
+        value = getattr(stats, column)
+        row[column] = "" if value is None else value
+    row["samples"] = stats.samples
+    return row
+
+
+class CampaignProcessor:
+    def __init__(self, input_path: str, output_file: str, workers: int = None):
+        """
+        Initializes the CampaignProcessor.
+
+        Args:
+        - input_path (str): Directory containing NMEA logs, or a glob pattern matching them.
+        - output_file (str): CSV file the per-file summary rows are appended to. Files
+          already summarized in it are skipped, which makes interrupted runs resumable.
+        - workers (int, optional): Number of worker processes. Defaults to the CPU count.
+        """
+        self.input_path = input_path
+        self.output_file = Path(output_file)
+        self.workers = workers or os.cpu_count() or 1
+        self.logger = Logger(__name__)
+
+    def collect_input_files(self) -> list[str]:
+        """
+        Resolves the input directory or glob pattern to a sorted list of log files,
+        leaving out the output file and files with one of the `IGNORED_SUFFIXES`.
+        """
+        if Path(self.input_path).is_dir():
+            candidates = Path(self.input_path).iterdir()
+        else:
+            candidates = (Path(p) for p in glob.glob(self.input_path, recursive=True))
+
+        output_file = self.output_file.resolve()
+        return sorted(
+            str(path.resolve())
+            for path in candidates
+            if path.is_file()
+            and path.resolve() != output_file
+            and not path.name.endswith(IGNORED_SUFFIXES)
+        )
+
+    def load_completed_rows(self) -> list[dict]:
+        """
+        Reads the rows of files that were fully and successfully summarized in a previous
+        run. Error rows and rows cut short by an interruption are dropped from the output
+        CSV, as their files are processed again.
+        """
+        if not self.output_file.exists():
+            return []
+
+        with open(self.output_file, newline="") as file:
+            content = file.read()
+        rows = list(csv.DictReader(content.splitlines()))
+        # A row cut short by an interruption has no 'error' value
+        completed_rows = [row for row in rows if row.get("error") == ""]
+
+        if len(completed_rows) != len(rows) or not content.endswith("\n"):
+            self.write_rows(completed_rows)
+        return completed_rows
+
+    def write_rows(self, rows: list[dict]) -> None:
+        """
+        Replaces the output CSV with `rows`, through a temporary file so an interruption
+        leaves either the old or the new content.
+        """
+        temp_file = self.output_file.with_name(f"{self.output_file.name}.tmp")
+        with open(temp_file, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=SUMMARY_COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(temp_file, self.output_file)
+
+    def process(self) -> list[dict]:
+        """
+        Summarizes every log of the campaign across a pool of worker processes.
+
+        Rows are appended to the output CSV as soon as each file finishes, so the work
+        done before an interruption is kept and skipped on the next run. Files that
+        failed are retried on every run and keep a single error row.
+
+        Returns:
+            list[dict]: Summary rows for all successfully processed files, including
+                the ones carried over from previous runs.
+        """
+        completed_rows = self.load_completed_rows()
+        completed_files = {row["file"] for row in completed_rows}
+        pending_files = [
+            f for f in self.collect_input_files() if f not in completed_files
+        ]
+        self.logger.info(
+            f"{len(pending_files)} files to process, "
+            f"{len(completed_files)} already summarized in {self.output_file}"
+        )
+        if not pending_files:
+            return completed_rows
+
+        self.output_file.parent.mkdir(parents=True, exist_ok=True)
+        write_header = (
+            not self.output_file.exists() or not self.output_file.stat().st_size
+        )
+
+        with open(self.output_file, "a", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=SUMMARY_COLUMNS)
+            if write_header:
+                writer.writeheader()
+
+            workers = min(self.workers, len(pending_files))
+            with Pool(workers, initializer=_init_worker) as pool:
+                for row in pool.imap_unordered(_summarize_file, pending_files):
+                    writer.writerow(row)
+                    file.flush()
+                    if row["error"]:
+                        self.logger.error(
+                            f"Failed to process {row['file']}: {row['error']}"
+                        )
+                    else:
+                        completed_rows.append(row)
+
+        return completed_rows
+
+
+def format_summary_table(rows: list[dict]) -> str:
+    """
+    Formats summary rows as a fixed-width table followed by campaign-wide totals.
+
+    Args:
+        rows (list[dict]): Summary rows as returned by `CampaignProcessor.process`.
+
+    Returns:
+        str: The table, ready to print.
+    """
+    columns = SUMMARY_COLUMNS[:-1]
+    table = [columns] + [
+        [os.path.basename(str(row["file"]))] + [str(row[c]) for c in columns[1:]]
+        for row in sorted(rows, key=lambda row: str(row["file"]))
+    ]
+    widths = [max(len(line[i]) for line in table) for i in range(len(columns))]
+    lines = [
+        "  ".join(value.ljust(w) for value, w in zip(line, widths)) for line in table
+    ]
+
+    ttffs = [float(row["ttff"]) for row in rows if row["ttff"] != ""]
+    availabilities = [
+        float(row["fix_availability"]) for row in rows if row["fix_availability"] != ""
+    ]
+    lines.append("")
+    lines.append(
+        f"Files: {len(rows)}  "
+        f"Mean TTFF: {round(mean(ttffs), 2) if ttffs else 'n/a'} s  "
+        f"Files without fix: {len(rows) - len(ttffs)}  "
+        f"Mean fix availability: "
+        f"{round(mean(availabilities), 2) if availabilities else 'n/a'} %"
+    )
+    return "\n".join(lines)
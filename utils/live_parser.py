@@ -1,22 +1,49 @@
+import threading
+import time
 import serial
-from parsers.gpgga_parser import GPGGAParser
-from services.ttff import TTFFService
+from data_types.records import WindowSummary
+from parsers.nmea_parser import IN_VIEW, NMEAParser
+from services.aggregation import WindowedAggregator
+from services.latency import LatencyTracker
 from presentation.data_plotter import DataPlotter
 from utils.logger import Logger
+from utils.ring_buffer import RingBuffer
+
+# Seconds a serial read waits for data before checking whether to stop
+SERIAL_READ_TIMEOUT = 0.1
 
 
 class LiveNMEAParser:
     def __init__(
-        self, serial_port: str, baudrate: int, parity: int = None, stopbit: int = 1
+        self,
+        serial_port: str,
+        baudrate: int,
+        parity: int = None,
+        stopbit: int = 1,
+        window: float = None,
+        buffer_size: int = 65536,
+        refresh_interval: float = 1.0,
     ):
         """
         Initialize the LiveNMEAParser.
 
+        The live path runs as three stages connected by bounded ring buffers: a reader
+        thread that only moves bytes from the serial port into `raw_buffer`, a parser
+        thread that frames and parses sentences and pushes new data rows into
+        `row_buffer`, and the renderer on the calling thread that redraws the plot every
+        `refresh_interval` seconds. A slow redraw therefore only lets the buffers fill
+        up and never delays `ser.read`.
+
         Args:
             serial_port (str): Serial port name (e.g., '/dev/ttyUSB0').
             baudrate (int): Baud rate for serial communication.
             parity (int, optional): Parity setting for serial communication. Default is None.
             stopbit (int, optional): Stop bit setting for serial communication. Default is 1.
+            window (float, optional): Aggregate the data over tumbling windows of this many
+                seconds and plot the windows instead of every sample. Default is None.
+            buffer_size (int, optional): Capacity of each ring buffer, in serial chunks for
+                the raw buffer and in data rows for the row buffer. Default is 65536.
+            refresh_interval (float, optional): Seconds between plot refreshes. Default is 1.0.
 
         Attributes:
             serial_port (str): Serial port name.
@@ -24,56 +51,189 @@ class LiveNMEAParser:
             parity (int): Parity setting.
             stopbit (int): Stop bit setting.
             logger (Logger): Logger instance.
-            parser (GPGGAParser): NMEA sentence parser.
-            ttff_service (TTFFService): TTFF service for tracking time to first fix.
+            aggregator (WindowedAggregator): Window aggregation, None when `window` is not set.
+            parser (NMEAParser): NMEA sentence parser, stamping sentences with their arrival time.
             data_plotter (DataPlotter): Data plotter for visualization.
+            raw_buffer (RingBuffer): (arrival time, bytes) chunks from the reader thread.
+            row_buffer (RingBuffer): (arrival time, data row) pairs from the parser thread, or
+                (arrival time, WindowSummary) pairs when `window` is set.
+            latency (LatencyTracker): Latency from serial arrival until a data row, or the
+                window the sample completed, is drawn by a plot refresh.
+            dropped_bytes (int): Serial bytes lost because `raw_buffer` was full.
         """
         self.serial_port = serial_port
         self.baudrate = baudrate
         self.parity = parity
         self.stopbit = stopbit
+        self.refresh_interval = refresh_interval
         self.logger = Logger("logger")
-        self.parser = GPGGAParser()
-        self.ttff_service = TTFFService()
+        self.aggregator = WindowedAggregator(window) if window else None
+        self.parser = NMEAParser(aggregator=self.aggregator)
         self.data_plotter = DataPlotter()
 
-    def read_live_data(self):
+        self.raw_buffer = RingBuffer(buffer_size)
+        self.row_buffer = RingBuffer(buffer_size)
+        self.latency = LatencyTracker()
+        # Arrival times of the rows handed to the plotter but not drawn yet
+        self.undrawn_arrivals = []
+        self.dropped_bytes = 0
+        self.stop_event = threading.Event()
+        self.start_time = None
+
+    def read_serial(self):
         """
-        Read live NMEA data from the serial port and yield sentences.
+        Reader stage: moves whatever bytes the serial port has into `raw_buffer`,
+        stamped with their arrival time, until `stop_event` is set.
+        """
+        try:
+            # Use a context manager for handling serial communication
+            with serial.Serial(
+                self.serial_port,
+                self.baudrate,
+                parity=self.parity,
+                stopbits=self.stopbit,
+                timeout=SERIAL_READ_TIMEOUT,
+            ) as ser:
+                while not self.stop_event.is_set():
+                    # Blocks for the first byte only, then takes everything pending
+                    chunk = ser.read(max(1, ser.in_waiting))
+                    if chunk and not self.raw_buffer.put((time.perf_counter(), chunk)):
+                        self.dropped_bytes += len(chunk)
+        except serial.SerialException as e:
+            self.logger.error(f"Serial port error: {e}")
+            self.stop_event.set()
+        finally:
+            self.raw_buffer.close()
 
-        Yields:
-            str: NMEA sentences received from the serial port.
+    def parse_chunks(self):
+        """
+        Parser stage: frames the raw chunks into sentences, parses them, and forwards the
+        data rows they produce to `row_buffer`, or the windows they complete when an
+        aggregator is set.
         """
-        # Use a context manager for handling serial communication
-        with serial.Serial(
-            self.serial_port, self.baudrate, parity=self.parity, stopbits=self.stopbit
-        ) as ser:
+        pending = b""
+        try:
             while True:
-                sentence = ser.readline().decode().strip()
-                yield sentence
+                item = self.raw_buffer.get(timeout=SERIAL_READ_TIMEOUT)
+                if item is None:
+                    if self.raw_buffer.closed and not len(self.raw_buffer):
+                        break
+                    continue
+
+                arrival_time, chunk = item
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    sentence = line.decode("ascii", "replace").strip()
+                    if not sentence:
+                        continue
+
+                    # A sentence adds at most one row, which becomes `last_row`. The
+                    # parser does not keep the rows itself when windows are aggregated
+                    last_row = self.parser.last_row
+                    num_windows = (
+                        len(self.aggregator.completed) if self.aggregator else 0
+                    )
+
+                    # Live sentences carry no log timestamp, so they are stamped with
+                    # the seconds elapsed since the capture started
+                    self.parser.parse_nmea(
+                        round(arrival_time - self.start_time, 3), sentence
+                    )
+
+                    if self.aggregator:
+                        for window in self.aggregator.completed[num_windows:]:
+                            self.row_buffer.put((arrival_time, window))
+                    elif self.parser.last_row is not last_row:
+                        self.row_buffer.put((arrival_time, self.parser.last_row))
+        finally:
+            self.row_buffer.close()
+
+    def render(self, rows: list):
+        """
+        Renderer stage: hands the new data rows, or completed windows, to the plotter.
+        They are drawn, and their latency recorded, by the next `refresh`.
+        """
+        for arrival_time, item in rows:
+            self.undrawn_arrivals.append(arrival_time)
+            if type(item) is WindowSummary:
+                self.data_plotter.add_window(item)
+                continue
+            timestamp, sat_type, count = item
+            if sat_type == IN_VIEW:
+                self.data_plotter.add_data_point(timestamp, None, count)
+            else:
+                self.data_plotter.add_data_point(timestamp, count, None)
+
+    def refresh(self):
+        """
+        Redraws the live plot and records the latency of the rows it drew for the first
+        time.
+        """
+        self.data_plotter.refresh_live_plot(self.parser.get_ttff())
+        drawn = time.perf_counter()
+        for arrival_time in self.undrawn_arrivals:
+            self.latency.record(drawn - arrival_time)
+        self.undrawn_arrivals.clear()
 
     def parse_and_plot(self):
         """
         Parse live NMEA data, plot the data, and log TTFF.
         """
-        timestamps = []
-        satellite_counts = []
-
-        for sentence in self.read_live_data():
-            timestamp, satellite_count = self.parser.parse_sentence(sentence)
-            if timestamp is not None and satellite_count is not None:
-                timestamps.append(timestamp)
-                satellite_counts.append(satellite_count)
-                self.ttff_service.update(timestamp, satellite_count)
+        self.start_time = time.perf_counter()
+        reader = threading.Thread(
+            target=self.read_serial, name="nmea-reader", daemon=True
+        )
+        parser = threading.Thread(
+            target=self.parse_chunks, name="nmea-parser", daemon=True
+        )
+        reader.start()
+        parser.start()
 
+        self.data_plotter.start_live_plot()
+        next_refresh = time.perf_counter()
+        try:
+            while not self.row_buffer.closed:
                 # Check for the end of a GPS scan (e.g., based on a condition)
                 if self.is_scan_complete():
                     break
 
+                self.render(self.row_buffer.get_all())
+                if time.perf_counter() >= next_refresh:
+                    self.refresh()
+                    self.log_pipeline_stats()
+                    next_refresh = time.perf_counter() + self.refresh_interval
+                time.sleep(0.05)
+        except KeyboardInterrupt:
+            self.logger.info("Stopping live capture")
+        finally:
+            self.stop_event.set()
+            reader.join()
+            parser.join()
+            self.render(self.row_buffer.get_all())
+            self.refresh()
+            self.data_plotter.stop_live_plot()
+
         # Post-processing
-        self.data_plotter.plot_data(timestamps, satellite_counts)
+        self.log_pipeline_stats()
+        ttff = self.parser.get_ttff()
+        if self.aggregator:
+            self.data_plotter.plot_windows(self.aggregator.flush(), ttff)
+        else:
+            self.data_plotter.plot_data(self.parser.get_data(), ttff)
+        self.logger.info(f"Time to First Fix (TTFF): {ttff} seconds")
+
+    def log_pipeline_stats(self):
+        """
+        Logs ring buffer overflows and high watermarks and the end-to-end latency
+        percentiles.
+        """
         self.logger.info(
-            f"Time to First Fix (TTFF): {self.ttff_service.get_ttff()} seconds"
+            f"Raw buffer: high watermark {self.raw_buffer.high_watermark}/"
+            f"{self.raw_buffer.capacity}, {self.raw_buffer.overflows} overflows "
+            f"({self.dropped_bytes} bytes dropped) - "
+            f"Row buffer: high watermark {self.row_buffer.high_watermark}/"
+            f"{self.row_buffer.capacity}, {self.row_buffer.overflows} overflows - "
+            f"Latency: {self.latency.summary()}"
         )
 
     def is_scan_complete(self):
@@ -0,0 +1,287 @@
+import bz2
+import gzip
+import io
+import lzma
+import zlib
+from bisect import bisect_right
+from pathlib import Path
+from typing import IO, Callable, Sequence
+
+# Size of the blocks pulled from disk and from the decompressors
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Leading bytes identifying each supported compression format
+GZIP_MAGIC = b"\x1f\x8b"
+BZIP2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Skippable zstd frames use magic numbers 0x184D2A50 to 0x184D2A5F (little endian)
+ZSTD_SKIPPABLE_MAGIC_MASK = 0xFFFFFFF0
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A50
+
+COMPRESSION_BY_EXTENSION = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+
+class _CompressedLogReader(io.BufferedReader):
+    """Buffered decompressed stream that also closes the underlying file on close."""
+
+    def __init__(self, decompressed: IO[bytes], source: IO[bytes]):
+        super().__init__(decompressed, buffer_size=READ_BLOCK_SIZE)
+        self._source = source
+
+    def close(self) -> None:
+        try:
+            super().close()
+        finally:
+            self._source.close()
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Reading zstd compressed logs requires the 'zstandard' package - "
+            "install it with `pip install zstandard`"
+        )
+    return zstandard
+
+
+def _open_zstd(raw: IO[bytes]) -> IO[bytes]:
+    return (
+        _import_zstandard()
+        .ZstdDecompressor()
+        .stream_reader(
+            raw, read_size=READ_BLOCK_SIZE, read_across_frames=True, closefd=True
+        )
+    )
+
+
+DECOMPRESSORS: dict[str, Callable[[IO[bytes]], IO[bytes]]] = {
+    "gzip": lambda raw: gzip.GzipFile(fileobj=raw, mode="rb"),
+    "bz2": lambda raw: bz2.BZ2File(raw, mode="rb"),
+    "xz": lambda raw: lzma.LZMAFile(raw, mode="rb"),
+    "zstd": _open_zstd,
+}
+
+
+def _skip_padding(data: bytes, compression: str) -> tuple[int, bool]:
+    """
+    Measures the bytes at the start of `data` that lie between two members and belong
+    to neither: null stream padding (xz) and skippable frames (zstd).
+
+    Returns:
+        tuple[int, bool]: The number of padding bytes, and False if `data` ends before
+            it is known whether more padding follows.
+    """
+    if compression == "xz":
+        return len(data) - len(data.lstrip(b"\0")), True
+    if compression != "zstd":
+        return 0, True
+
+    skipped = 0
+    while True:
+        if len(data) - skipped < 8:
+            return skipped, len(data) == skipped
+        magic = int.from_bytes(data[skipped : skipped + 4], "little")
+        if magic & ZSTD_SKIPPABLE_MAGIC_MASK != ZSTD_SKIPPABLE_MAGIC:
+            return skipped, True
+        size = int.from_bytes(data[skipped + 4 : skipped + 8], "little")
+        if len(data) - skipped < 8 + size:
+            return skipped, False
+        skipped += 8 + size
+
+
+def _new_member_decompressor(compression: str):
+    if compression == "gzip":
+        return zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    if compression == "bz2":
+        return bz2.BZ2Decompressor()
+    if compression == "xz":
+        return lzma.LZMADecompressor()
+    return _import_zstandard().ZstdDecompressor().decompressobj()
+
+
+def list_members(path: str) -> list[tuple[int, int]]:
+    """
+    Finds the independently decompressible members of a compressed log: gzip members,
+    bzip2 and xz streams, zstd frames. Files written by parallel or block compressors
+    (bgzip, pigz --independent, pbzip2, pixz, pzstd) or simply concatenated hold many
+    of them, and decompression can start at any of them.
+
+    The whole file is decompressed once, the output is discarded.
+
+    Args:
+        path (str): Path to the log file.
+
+    Returns:
+        list[tuple[int, int]]: (compressed offset, decompressed offset) of the start of
+            every member in file order, empty for plain text logs.
+    """
+    compression = detect_compression(path)
+    if compression == "none":
+        return []
+
+    members = []
+    decompressor = None
+    compressed_offset = decompressed_offset = 0
+    with open(path, "rb") as file:
+        pending = b""
+        while True:
+            block = file.read(READ_BLOCK_SIZE)
+            if not block and not pending:
+                break
+            data = pending + block
+            pending = b""
+            while data:
+                if decompressor is None:
+                    # Between members: skip padding, then start the next member
+                    skipped, complete = _skip_padding(data, compression)
+                    compressed_offset += skipped
+                    data = data[skipped:]
+                    if not complete and block:
+                        pending = data  # Wait for the rest of the padding
+                        break
+                    if not data:
+                        break
+                    members.append((compressed_offset, decompressed_offset))
+                    decompressor = _new_member_decompressor(compression)
+
+                decompressed_offset += len(decompressor.decompress(data))
+                if not decompressor.eof:
+                    compressed_offset += len(data)
+                    break
+                unused = decompressor.unused_data
+                compressed_offset += len(data) - len(unused)
+                data = unused
+                decompressor = None
+            if not block:
+                break
+    return members
+
+
+def detect_compression(path: str) -> str:
+    """
+    Detects the compression format of a log file.
+
+    The leading magic bytes are checked first, so misnamed files are still read
+    correctly, falling back to the file extension.
+
+    Args:
+        path (str): Path to the log file.
+
+    Returns:
+        str: One of "gzip", "bz2", "xz", "zstd" or "none" for plain text.
+    """
+    with open(path, "rb") as file:
+        head = file.read(len(XZ_MAGIC))
+
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(BZIP2_MAGIC):
+        return "bz2"
+    if head.startswith(XZ_MAGIC):
+        return "xz"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return COMPRESSION_BY_EXTENSION.get(Path(path).suffix.lower(), "none")
+
+
+def open_log(path: str, binary: bool = False) -> IO:
+    """
+    Opens a plain or compressed NMEA log for streaming reads.
+
+    Compressed logs are decompressed on the fly in `READ_BLOCK_SIZE` blocks, so no
+    temporary file is written and memory use does not depend on the file size.
+
+    Args:
+        path (str): Path to the log file.
+        binary (bool, optional): Return the decompressed byte stream instead of a
+            text stream. Defaults to False.
+
+    Returns:
+        IO: A readable, line-iterable file object. The caller is responsible for closing it.
+    """
+    compression = detect_compression(path)
+    raw = open(path, "rb", buffering=READ_BLOCK_SIZE)
+
+    if compression == "none":
+        stream = raw
+    else:
+        try:
+            stream = _CompressedLogReader(DECOMPRESSORS[compression](raw), raw)
+        except Exception:
+            raw.close()
+            raise
+
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+
+
+def open_log_at(
+    path: str, offset: int, members: Sequence[tuple[int, int]] = ()
+) -> IO[bytes]:
+    """
+    Opens a log as a binary stream positioned at a decompressed byte offset.
+
+    With the `members` of a compressed log (see `list_members`), decompression starts
+    at the last member before `offset` instead of at the start of the file, so only
+    that member is decompressed and skipped.
+
+    Args:
+        path (str): Path to the log file.
+        offset (int): Byte offset in the decompressed content.
+        members (Sequence[tuple[int, int]], optional): Member offsets of the log.
+            Defaults to none (decompress from the start).
+
+    Returns:
+        IO[bytes]: The positioned stream. The caller is responsible for closing it.
+    """
+    compression = detect_compression(path)
+    position = bisect_right([start for _, start in members], offset) - 1
+    if compression == "none" or position <= 0:
+        stream = open_log(path, binary=True)
+        seek_log(stream, offset)
+        return stream
+
+    compressed_offset, decompressed_offset = members[position]
+    raw = open(path, "rb", buffering=READ_BLOCK_SIZE)
+    try:
+        raw.seek(compressed_offset)
+        stream = _CompressedLogReader(DECOMPRESSORS[compression](raw), raw)
+    except Exception:
+        raw.close()
+        raise
+    seek_log(stream, offset - decompressed_offset)
+    return stream
+
+
+def seek_log(stream: IO[bytes], offset: int) -> None:
+    """
+    Moves a freshly opened binary log stream forward to a decompressed byte offset.
+    Streams that cannot seek (zstd) are skipped forward by reading and discarding
+    `READ_BLOCK_SIZE` blocks.
+
+    Args:
+        stream (IO[bytes]): Binary log stream.
+        offset (int): Byte offset in the decompressed content.
+    """
+    if stream.seekable():
+        stream.seek(offset)
+        return
+
+    remaining = offset
+    while remaining > 0:
+        block = stream.read(min(remaining, READ_BLOCK_SIZE))
+        if not block:
+            break
+        remaining -= len(block)
@@ -1,17 +1,39 @@
 from parsers.nmea_parser import NMEAParser
 from presentation.data_plotter import DataPlotter
+from services.aggregation import WindowedAggregator
+from services.time_index import TimeIndex
 from utils.logger import Logger
 
 
 class OfflineNMEAProcessor:
-    def __init__(self, input_file: str):
+    def __init__(
+        self,
+        input_file: str,
+        window: float = None,
+        step: float = None,
+        build_index: bool = False,
+        events_file: str = None,
+    ):
         """
         Initializes the OfflineNMEAProcessor.
 
         Args:
         - input_file (str): Path to the NMEA log file to be processed.
+        - window (float, optional): Aggregate and plot the data over windows of this many
+          seconds instead of plotting every sample. Defaults to None.
+        - step (float, optional): Distance between window starts in seconds, for sliding
+          windows. Defaults to `window` (tumbling windows).
+        - build_index (bool, optional): Save a sparse time index next to the log while
+          parsing it, for later range queries. Defaults to False.
+        - events_file (str, optional): Record the data as change events and run-length
+          encoded rows instead of one row per sample, and export them as JSON to this
+          path. Defaults to None.
         """
         self.input_file = input_file
+        self.window = window
+        self.step = step
+        self.build_index = build_index
+        self.events_file = events_file
         self.logger = Logger(__name__)
 
     def process(self):
@@ -25,18 +47,42 @@ class OfflineNMEAProcessor:
         self.logger.info(f"Processing input file: {self.input_file}")
 
         # Initialize parser and data plotter
-        parser = NMEAParser()
+        aggregator = WindowedAggregator(self.window, self.step) if self.window else None
+        parser = NMEAParser(
+            aggregator=aggregator, record_events=self.events_file is not None
+        )
         data_plotter = DataPlotter()
 
         # Parse the entire log file
-        parser.parse_log_file(self.input_file)
-
-        # Fetching parsed data and plotting
-        data = parser.get_data()
-        if data:
-            ttff = parser.get_ttff()
-            data_plotter.plot_data(data, ttff)
-            if ttff is not None:
-                self.logger.info(f"Time to First Fix (TTFF): {ttff} seconds")
+        index = TimeIndex() if self.build_index else None
+        parser.parse_log_file(self.input_file, index)
+        if index is not None:
+            index_file = TimeIndex.index_path(self.input_file)
+            try:
+                index.save(index_file)
+            except OSError as e:
+                self.logger.error(f"Could not save time index {index_file}: {e}")
+        if self.events_file:
+            parser.event_recorder.export(self.events_file)
+            self.logger.info(
+                f"Exported {len(parser.get_events())} change events covering "
+                f"{len(parser.event_recorder)} data rows to {self.events_file}"
+            )
+
+        # Fetching parsed data and plotting. With an aggregator only the window
+        # summaries are kept, no per-sample rows, and in event mode the rows are
+        # decoded one at a time while plotting instead of rebuilt as a list
+        ttff = parser.get_ttff()
+        if aggregator:
+            windows = aggregator.flush()
+            if not windows:
+                self.logger.warning("No data available to plot.")
+                return
+            data_plotter.plot_windows(windows, ttff)
         else:
-            self.logger.warning("No data available to plot.")
+            if parser.last_row is None:
+                self.logger.warning("No data available to plot.")
+                return
+            data_plotter.plot_data(parser.iter_data(), ttff)
+        if ttff is not None:
+            self.logger.info(f"Time to First Fix (TTFF): {ttff} seconds")
@@ -0,0 +1,65 @@
+import time
+from typing import Optional
+
+from parsers.nmea_parser import NMEAParser
+from services.time_index import TimeIndex
+from utils.logger import Logger
+
+
+class RangeQueryProcessor:
+    def __init__(
+        self, input_file: str, every_lines: int = 10000, every_seconds: float = None
+    ):
+        """
+        Initializes the RangeQueryProcessor.
+
+        Args:
+        - input_file (str): Path to the NMEA log file to query.
+        - every_lines (int, optional): Lines between index checkpoints, used when the
+          index has to be built. Defaults to 10000.
+        - every_seconds (float, optional): Log seconds between index checkpoints, used when
+          the index has to be built. Defaults to None.
+        """
+        self.input_file = input_file
+        self.index_file = TimeIndex.index_path(input_file)
+        self.every_lines = every_lines
+        self.every_seconds = every_seconds
+        self.logger = Logger(__name__)
+        self.parser = NMEAParser()
+
+    def load_or_build_index(self) -> TimeIndex:
+        """
+        Loads the index saved next to the log, or builds and saves it with one full
+        parse if it is missing or the log changed since it was built. If the index
+        cannot be saved (e.g. a read-only archive) it is only used in memory.
+        """
+        index: Optional[TimeIndex] = TimeIndex.load(self.index_file)
+        if index is not None and index.is_current(self.input_file):
+            return index
+
+        self.logger.info(f"Building time index {self.index_file}")
+        index = TimeIndex(self.every_lines, self.every_seconds)
+        self.parser.reset()
+        self.parser.parse_log_file(self.input_file, index)
+        try:
+            index.save(self.index_file)
+        except OSError as e:
+            self.logger.warning(
+                f"Could not save time index {self.index_file}, it is rebuilt on the "
+                f"next run: {e}"
+            )
+        return index
+
+    def query(self, start: float, end: float) -> list[tuple[float, str, int]]:
+        """
+        Returns the data rows with timestamps in [start, end].
+        """
+        index = self.load_or_build_index()
+
+        started = time.perf_counter()
+        rows = self.parser.parse_log_range(self.input_file, start, end, index)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.logger.info(
+            f"{len(rows)} rows between t={start} and t={end} in {elapsed_ms:.1f} ms"
+        )
+        return rows
@@ -0,0 +1,81 @@
+import threading
+from collections import deque
+from typing import Any, Optional
+
+
+class RingBuffer:
+    def __init__(self, capacity: int):
+        """
+        Bounded, thread-safe FIFO connecting two pipeline stages.
+
+        `put` never blocks: when the buffer is full the item is rejected and counted in
+        `overflows`, so a slow consumer can never stall the producer.
+
+        Args:
+            capacity (int): Maximum number of items held.
+
+        Attributes:
+            overflows (int): Number of items rejected because the buffer was full.
+            high_watermark (int): Highest number of items held at once.
+        """
+        if capacity <= 0:
+            raise ValueError("Ring buffer capacity must be positive")
+        self.capacity = capacity
+        self.overflows = 0
+        self.high_watermark = 0
+        self._items = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: Any) -> bool:
+        """
+        Adds an item without blocking.
+
+        Returns:
+            bool: False if the buffer was full and the item was dropped.
+        """
+        with self._condition:
+            if len(self._items) >= self.capacity:
+                self.overflows += 1
+                return False
+            self._items.append(item)
+            if len(self._items) > self.high_watermark:
+                self.high_watermark = len(self._items)
+            self._condition.notify()
+            return True
+
+    def get(self, timeout: float = None) -> Optional[Any]:
+        """
+        Removes the oldest item, waiting up to `timeout` seconds for one.
+
+        Returns:
+            Optional[Any]: The item, or None on timeout or once the buffer is closed and empty.
+        """
+        with self._condition:
+            if not self._items and not self._closed:
+                self._condition.wait(timeout)
+            return self._items.popleft() if self._items else None
+
+    def get_all(self) -> list:
+        """
+        Removes and returns every item currently held, without waiting.
+        """
+        with self._condition:
+            items = list(self._items)
+            self._items.clear()
+            return items
+
+    def close(self) -> None:
+        """
+        Marks the end of the stream and wakes up any waiting consumer.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()